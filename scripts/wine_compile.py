@@ -13,10 +13,148 @@ import platform
 import zipfile
 import shutil
 import time
+import urllib.request
+import hashlib
+import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+EMBED_URL = "https://www.python.org/ftp/python/3.10.11/python-3.10.11-embed-amd64.zip"
+PIP_URL = "https://bootstrap.pypa.io/get-pip.py"
+EMBED_PYTHON_VERSION = "3.10"
+
+# Pacotes instalados no Python do Wine para o build (mesmas versões do
+# requirements.txt); as versões entram no stamp de _toolchain_stamp
+BUILD_PACKAGES = ("pip==24.0", "pyinstaller==6.6.0", "PyQt6==6.7.0", "pillow==10.4.0")
+WHEELS_DIR = Path("temp/wheels")
+
+# Cache do Python embarcado já extraído (+ get-pip.py), reaproveitado entre builds
+CACHE_ROOT = Path.home() / ".cache" / "simplerename" / "wine-build"
+
+
+def _embed_cache_dir():
+    """Diretório de cache para o par de URLs atual (muda se alguma URL mudar)"""
+    key = hashlib.sha256(f"{EMBED_URL}\n{PIP_URL}".encode()).hexdigest()[:16]
+    return CACHE_ROOT / key
+
+
+def _toolchain_stamp():
+    """Identifica a configuração do ambiente (Python embarcado + pacotes e versões)"""
+    return {"embed_url": EMBED_URL, "packages": list(BUILD_PACKAGES)}
+
+
+def _is_ready(stamp_file):
+    """True se o ambiente já foi configurado com a configuração atual"""
+    try:
+        return json.loads(stamp_file.read_text()) == _toolchain_stamp()
+    except (OSError, ValueError):
+        return False
+
+
+def run_quiet(cmd):
+    """Executa cmd capturando a saída; só a imprime se o comando falhar"""
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    if result.returncode:
+        print(result.stdout)
+        print(result.stderr)
+        raise subprocess.CalledProcessError(result.returncode, cmd,
+                                            result.stdout, result.stderr)
+    return result
+
+
+def _prefetch_wheels(wheels_dir):
+    """Baixa no host as wheels Windows dos pacotes de build.
+
+    Retorna True se todas foram baixadas; nesse caso o pip do Wine instala
+    sem acessar o PyPI.
+    """
+    print("Baixando wheels para Windows no host...")
+    try:
+        run_quiet([
+            sys.executable, "-m", "pip", "download", "-d", str(wheels_dir),
+            "--platform", "win_amd64", "--only-binary=:all:",
+            "--python-version", EMBED_PYTHON_VERSION, *BUILD_PACKAGES,
+        ])
+        return True
+    except (OSError, subprocess.CalledProcessError) as e:
+        print(f"Aviso: download de wheels no host falhou ({e}); o pip do Wine usará o PyPI")
+        return False
+
+
+def _download(url, dest):
+    """Baixa url para dest"""
+    print(f"Baixando {url}...")
+    with urllib.request.urlopen(url) as response, open(dest, "wb") as f:
+        shutil.copyfileobj(response, f, length=1 << 20)
+
+
+def _prepare_embedded_python(portable_py_dir, pip_file):
+    """Extrai o Python embarcado em portable_py_dir, usando o cache quando possível"""
+    cache_dir = _embed_cache_dir()
+    if (cache_dir / "python.exe").exists():
+        print(f"Usando Python embarcado em cache: {cache_dir}")
+        # Cópia, não hardlink: o pip do Wine grava nesta árvore e não pode
+        # alterar os arquivos do cache (~15 MB)
+        shutil.copytree(cache_dir, portable_py_dir, dirs_exist_ok=True)
+        return
+
+    print("Python portátil não encontrado. Baixando Python embarcado (não requer instalação)...")
+    embed_file = Path("temp/python-embed.zip")
+    os.makedirs(portable_py_dir, exist_ok=True)
+
+    # Os dois downloads são independentes: baixa em paralelo
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        downloads = [pool.submit(_download, EMBED_URL, embed_file),
+                     pool.submit(_download, PIP_URL, pip_file)]
+        for future in downloads:
+            future.result()
+
+    print("Extraindo Python embarcado...")
+    with zipfile.ZipFile(embed_file) as z:
+        z.extractall(portable_py_dir)
+    print("Python embarcado extraído.")
+
+    # Modifica python310._pth para habilitar import site
+    pth_file = portable_py_dir / "python310._pth"
+    if pth_file.exists():
+        print("Configurando Python embarcado para suportar pip...")
+        with open(pth_file, 'r') as f:
+            content = f.read()
+
+        # Descomenta a linha import site
+        content = content.replace("#import site", "import site")
+
+        with open(pth_file, 'w') as f:
+            f.write(content)
+
+    # Guarda a árvore limpa (antes do pip) para os próximos builds. A cópia vai
+    # para um diretório irmão e só então é movida: o cache é considerado válido
+    # assim que python.exe existe, então nunca pode ficar pela metade
+    tmp_dir = cache_dir.with_name(cache_dir.name + ".tmp")
+    try:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        shutil.copytree(portable_py_dir, tmp_dir)
+        # Sobra de um cache incompleto (sem python.exe) impediria a troca
+        shutil.rmtree(cache_dir, ignore_errors=True)
+        os.replace(tmp_dir, cache_dir)
+    except OSError as e:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        print(f"Aviso: não foi possível gravar o cache em {cache_dir}: {e}")
+
+
 def setup_wine_environment():
     """Configura o ambiente Wine para compilação cross-platform"""
+    portable_py_dir = Path("temp/python-embed")
+    python_exe = portable_py_dir / "python.exe"
+    pip_file = portable_py_dir / "get-pip.py"
+    stamp_file = portable_py_dir / ".ready"
+
+    # Configura variáveis de ambiente do Wine ("-all" já silencia os fixme:)
+    os.environ["WINEDEBUG"] = "-all"
+    os.environ["WINEDLLOVERRIDES"] = "mscoree,mshtml="
+    # Define o caminho do Python como variável de ambiente
+    os.environ["WINE_PYTHON"] = str(python_exe)
+
     try:
         # Verifica se o Wine está instalado
         wine_version = subprocess.run(
@@ -30,69 +168,19 @@ def setup_wine_environment():
 
         print(f"Wine encontrado: {wine_version.stdout.strip()}")
 
-        # Configura variáveis de ambiente do Wine
-        os.environ["WINEDEBUG"] = "-all"
-        os.environ["WINEDLLOVERRIDES"] = "mscoree,mshtml="
+        # Ambiente já configurado com a mesma configuração: pula o restante
+        if python_exe.exists() and _is_ready(stamp_file):
+            print("Ambiente Wine já configurado (stamp atualizado)")
+            return True
 
         # Cria diretório temporário
         os.makedirs("temp", exist_ok=True)
 
         # Verifica se o Python portátil já existe
-        portable_py_dir = Path("temp/python-embed")
-        python_exe = portable_py_dir / "python.exe"
-        pip_file = portable_py_dir / "get-pip.py"
-
         if not python_exe.exists():
-            print("Python portátil não encontrado. Baixando Python embarcado (não requer instalação)...")
-
-            # Abordagem com Python embarcado
-            embed_url = "https://www.python.org/ftp/python/3.10.11/python-3.10.11-embed-amd64.zip"
-            embed_file = "temp/python-embed.zip"
-
-            print(f"Baixando {embed_url}...")
-            subprocess.run(
-                ["wget", "-O", embed_file, embed_url],
-                check=True
-            )
-
-            # Extrair Python embarcado
-            os.makedirs(portable_py_dir, exist_ok=True)
-
-            print("Extraindo Python embarcado...")
-            subprocess.run(
-                ["7z", "x", embed_file, f"-o{portable_py_dir}"],
-                check=True
-            )
-
-            print("Python embarcado extraído.")
-
-            # Baixa e instala get-pip.py
-            pip_url = "https://bootstrap.pypa.io/get-pip.py"
-
-            print("Baixando get-pip.py...")
-            subprocess.run(
-                ["wget", "-O", str(pip_file), pip_url],
-                check=True
-            )
-
-            # Modifica python310._pth para habilitar import site
-            pth_file = portable_py_dir / "python310._pth"
-            if pth_file.exists():
-                print("Configurando Python embarcado para suportar pip...")
-                with open(pth_file, 'r') as f:
-                    content = f.read()
-
-                # Descomenta a linha import site
-                content = content.replace("#import site", "import site")
-
-                with open(pth_file, 'w') as f:
-                    f.write(content)
-
+            _prepare_embedded_python(portable_py_dir, pip_file)
             print(f"Python portátil configurado em: {python_exe}")
 
-        # Define o caminho do Python como variável de ambiente
-        os.environ["WINE_PYTHON"] = str(python_exe)
-
         # Testa se o Python está funcionando
         try:
             print("Testando Python no Wine...")
@@ -123,38 +211,26 @@ def setup_wine_environment():
             if not pip_exe.exists():
                 # Verifica se get-pip.py existe, caso contrário, baixa
                 if not pip_file.exists():
-                    print("Baixando get-pip.py...")
-                    pip_url = "https://bootstrap.pypa.io/get-pip.py"
-                    subprocess.run(
-                        ["wget", "-O", str(pip_file), pip_url],
-                        check=True
-                    )
+                    _download(PIP_URL, pip_file)
 
                 # Instala pip
                 print("Instalando pip...")
-                subprocess.run(
-                    ["wine", str(python_exe), str(pip_file)],
-                    check=True
-                )
+                run_quiet(["wine", str(python_exe), str(pip_file)])
 
             # Verifica novamente se pip foi instalado corretamente
             if not pip_exe.exists():
                 print(f"Pip não foi instalado corretamente. Arquivo não encontrado: {pip_exe}")
                 return False
 
-            print("Atualizando pip...")
-            subprocess.run(
-                ["wine", str(pip_exe), "install", "--upgrade", "pip"],
-                check=True
-            )
-
-            # Instala PyInstaller, PyQt6 e Pillow
-            print("Instalando PyInstaller, PyQt6 e Pillow (isso pode demorar)...")
-            subprocess.run(
-                ["wine", str(pip_exe), "install", "pyinstaller", "PyQt6", "pillow"],
-                check=True
-            )
+            # Atualiza pip e instala PyInstaller, PyQt6 e Pillow numa única
+            # execução do pip no Wine, a partir de wheels baixadas no host
+            print("Instalando pip, PyInstaller, PyQt6 e Pillow (isso pode demorar)...")
+            install_cmd = ["wine", str(pip_exe), "install", "--upgrade", *BUILD_PACKAGES]
+            if _prefetch_wheels(WHEELS_DIR):
+                install_cmd += ["--no-index", f"--find-links={WHEELS_DIR}"]
+            run_quiet(install_cmd)
 
+            stamp_file.write_text(json.dumps(_toolchain_stamp()))
             print("Ambiente Wine configurado com sucesso para compilação cross-platform")
             return True
         except subprocess.CalledProcessError as e:
@@ -183,9 +259,9 @@ def build_windows_executable():
     icon_path = Path("resources/icons/simplerename.ico")
     if not icon_path.exists():
         print("Aviso: Ícone não encontrado")
-        icon_param = ""
+        icon_spec = None
     else:
-        icon_param = f"--icon={icon_path}"
+        icon_spec = repr(str(icon_path))
 
     try:
         print("Compilando executável Windows com PyInstaller via Wine...")
@@ -193,40 +269,8 @@ def build_windows_executable():
         # Obtém o caminho do Python no ambiente Wine
         py_command = os.environ.get("WINE_PYTHON", "python")
 
-        # Comando para PyInstaller no Wine
-        cmd = [
-            "wine", py_command, "-m", "PyInstaller",
-            "--clean",
-            "--noconfirm",
-            "--onefile",
-            "--windowed",
-            icon_param,
-            "--name=SimpleRename",
-            "--distpath=dist-windows",
-            "--add-data=resources;resources",
-            "--hidden-import=PyQt6",
-            "--hidden-import=PyQt6.QtCore",
-            "--hidden-import=PyQt6.QtGui",
-            "--hidden-import=PyQt6.QtWidgets",
-            "main.py"
-        ]
-
-        # Remove parâmetros vazios
-        cmd = [c for c in cmd if c]
-
-        print(f"Executando comando: {' '.join(cmd)}")
-
-        # Executa o comando
-        result = subprocess.run(cmd, capture_output=True, text=True)
-
-        # Verifica se houve erro e tenta uma abordagem alternativa
-        if result.returncode != 0:
-            print("Erro na compilação com PyInstaller. Detalhes:")
-            print(result.stderr)
-            print("Tentando abordagem alternativa com spec file...")
-
-            # Cria um arquivo .spec para o PyInstaller
-            spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
+        # Gera o arquivo .spec e compila sempre a partir dele (uma única análise)
+        spec_content = f"""# -*- mode: python ; coding: utf-8 -*-
 
 block_cipher = None
 
@@ -268,25 +312,24 @@ exe = EXE(
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
-    icon='{icon_path}' if os.path.exists('{icon_path}') else None,
+    icon={icon_spec},
 )
 """
 
-            # Salva o arquivo .spec
-            with open("SimpleRename_wine.spec", "w") as f:
-                f.write(spec_content)
-
-            # Tenta compilar usando o arquivo .spec
-            alt_cmd = [
-                "wine", py_command, "-m", "PyInstaller",
-                "--clean",
-                "--noconfirm",
-                "SimpleRename_wine.spec",
-                f"--distpath=dist-windows"
-            ]
-
-            print(f"Executando comando alternativo: {' '.join(alt_cmd)}")
-            subprocess.run(alt_cmd, check=True)
+        # Salva o arquivo .spec
+        with open("SimpleRename_wine.spec", "w") as f:
+            f.write(spec_content)
+
+        cmd = [
+            "wine", py_command, "-m", "PyInstaller",
+            "--clean",
+            "--noconfirm",
+            "SimpleRename_wine.spec",
+            "--distpath=dist-windows"
+        ]
+
+        print(f"Executando comando: {' '.join(cmd)}")
+        run_quiet(cmd)
 
         # Verifica se o executável foi criado
         exe_path = dist_dir / "SimpleRename.exe"
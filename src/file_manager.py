@@ -12,18 +12,24 @@ Used by:
 - rename_controller.py: For executing operations
 """
 import os
+import sys
 import shutil
 import logging
 from dataclasses import dataclass, field as dc_field
-from typing import List, Dict, Any, Optional
-from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from typing import List, Dict, Any, Callable, Optional
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
 from PyQt6.QtGui import QColor, QBrush, QPalette
 from PyQt6.QtWidgets import QApplication
 from datetime import datetime
 from .pdf_metadata_extractor import MetadataQuality
 
 
-@dataclass
+# __slots__ em dataclass exige Python 3.10+; em versões anteriores FileRow
+# continua com __dict__ por instância.
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class FileRow:
     """Representa uma linha da planilha com faixa azul (atual) e verde (proposta)."""
 
@@ -120,22 +126,147 @@ HEADERS = [
 ]
 
 
+# Cores de fundo por tipo de célula: (RGB tema claro, RGB tema escuro)
+_BAND_COLORS = {
+    "selected":     ((242, 242, 242), (50, 50, 55)),
+    "blue":         ((210, 230, 248), (30, 60, 100)),
+    "preview":      ((235, 235, 235), (50, 50, 60)),
+    "invalid_isbn": ((255, 200, 200), (80, 10, 10)),
+    "filled":       ((200, 235, 200), (20, 70, 30)),
+    "empty":        ((255, 255, 255), (45, 45, 50)),
+}
+
+
+def _is_dark_palette() -> bool:
+    """Indica se a paleta atual da aplicação é escura."""
+    return QApplication.palette().color(QPalette.ColorRole.Window).lightness() < 128
+
+
+# Texto exibido por coluna, chaveado pelas constantes COL_*.
+_DISPLAY_GETTER_BY_COL = {
+    COL_SELECTED:    lambda r: None,  # via CheckStateRole
+    COL_CURR_NAME:   lambda r: r.current_filename,
+    COL_FORMAT:      lambda r: r.file_extension.lstrip("."),
+    COL_CURR_TITLE:  lambda r: r.current_title or "",
+    COL_CURR_AUTHOR: lambda r: r.current_author or "",
+    COL_CURR_ISBN:   lambda r: r.current_isbn or "",
+    COL_CURR_YEAR:   lambda r: r.current_year or "",
+    COL_CURR_PUB:    lambda r: r.current_publisher or "",
+    COL_NEW_NAME:    lambda r: r.new_filename or "",
+    COL_NEW_TITLE:   lambda r: r.new_title or "",
+    COL_NEW_AUTHOR:  lambda r: r.new_author or "",
+    COL_NEW_YEAR:    lambda r: r.new_year or "",
+    COL_NEW_PUB:     lambda r: r.new_publisher or "",
+    COL_NEW_ISBN:    lambda r: r.new_isbn or "",
+    COL_NEW_CLASSIF: lambda r: r.new_classification or "",
+    COL_NEW_CATALOG: lambda r: r.new_catalog or "",
+    COL_PREVIEW:     lambda r: r.preview,
+}
+
+# Mesmo conteúdo como tupla indexada pelo número da coluna: data() faz um
+# único acesso à tupla em vez de percorrer uma cadeia de comparações.
+# Uma coluna sem getter falha aqui, na importação, com KeyError.
+_DISPLAY_GETTERS = tuple(_DISPLAY_GETTER_BY_COL[col] for col in range(len(HEADERS)))
+
+
 class DualBandTableModel(QAbstractTableModel):
     """Model de planilha com faixa azul (estado atual) e faixa verde (proposta de mudanca)."""
 
+    # Flags pré-calculadas: flags() é chamado pela view para cada célula pintada
+    _FLAGS_CHECKABLE = (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                        | Qt.ItemFlag.ItemIsUserCheckable)
+    _FLAGS_READONLY  = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+    _FLAGS_EDITABLE  = (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+                        | Qt.ItemFlag.ItemIsEditable)
+    # Linhas entregues à view por vez; pastas grandes não são inseridas de uma vez
+    FETCH_BATCH = 256
+    # Roles afetados por uma edição na faixa verde (texto, cor e origem)
+    _EDIT_ROLES = [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole,
+                   Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ToolTipRole]
+    # Roles respondidos por data(); a view consulta vários outros (fonte,
+    # alinhamento, decoração...) por célula pintada, e esses saem logo de cara
+    _DATA_ROLES = frozenset((Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.CheckStateRole,
+                             Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ToolTipRole))
+
     def __init__(self) -> None:
         """Inicializa o model com lista vazia de linhas."""
         super().__init__()
         self.rows: List[FileRow] = []
+        # Coluna paralela a rows com as extensões em minúsculas, usada pelo filtro
+        self._ext_lower: List[str] = []
+        # (tipo de célula, is_dark) -> QBrush, evita alocar cores a cada pintura
+        self._brush_cache: Dict[tuple, QBrush] = {}
+        # Linhas em rows ainda não entregues à view (carga incremental via fetchMore)
+        self._pending = 0
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
-        """Retorna o numero de linhas."""
-        return len(self.rows)
+        """Retorna o numero de linhas já entregues à view (ver fetchMore)."""
+        return len(self.rows) - self._pending
+
+    def canFetchMore(self, parent: QModelIndex = QModelIndex()) -> bool:
+        """Indica se ainda há linhas carregadas que a view não recebeu."""
+        return not parent.isValid() and self._pending > 0
+
+    def fetchMore(self, parent: QModelIndex = QModelIndex()) -> None:
+        """Entrega o próximo lote de FETCH_BATCH linhas à view (chamado ao rolar)."""
+        if parent.isValid() or self._pending <= 0:
+            return
+        first = self.rowCount()
+        count = min(self._pending, self.FETCH_BATCH)
+        self.beginInsertRows(QModelIndex(), first, first + count - 1)
+        self._pending -= count
+        self.endInsertRows()
+
+    def fetch_all(self) -> None:
+        """Entrega de uma vez todas as linhas pendentes à view.
+
+        Usado com filtro ativo: se as últimas linhas entregues estão ocultas,
+        a view nunca rola até elas e o fetchMore deixaria de ser chamado.
+        """
+        if self._pending <= 0:
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, len(self.rows) - 1)
+        self._pending = 0
+        self.endInsertRows()
 
     def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
         """Retorna o numero fixo de colunas."""
         return len(HEADERS)
 
+    def _emit_row_changed(self, row_idx: int, first_col: int, last_col: int,
+                          roles: Optional[list] = None) -> None:
+        """Emite dataChanged para a linha, se ela já foi entregue à view."""
+        if row_idx >= self.rowCount():
+            return  # a linha será lida com os dados atuais quando for buscada
+        tl = self.index(row_idx, first_col)
+        br = self.index(row_idx, last_col)
+        if roles is None:
+            self.dataChanged.emit(tl, br)
+        else:
+            self.dataChanged.emit(tl, br, roles)
+
+    def emit_rows_changed(self, rows: List[int], first_col: int, last_col: int,
+                          roles: Optional[list] = None) -> None:
+        """Emite um único dataChanged cobrindo as linhas alteradas em lote.
+
+        Args:
+            rows: Índices alterados, em ordem crescente.
+            first_col: Primeira coluna do intervalo.
+            last_col: Última coluna do intervalo.
+            roles: Roles afetados, ou None para todos.
+        """
+        fetched = self.rowCount()
+        last = next((r for r in reversed(rows) if r < fetched), None)
+        if last is None:
+            return  # nenhuma linha alterada foi entregue à view ainda
+        tl = self.index(rows[0], first_col)
+        br = self.index(last, last_col)
+        if roles is None:
+            self.dataChanged.emit(tl, br)
+        else:
+            self.dataChanged.emit(tl, br, roles)
+
     def headerData(self, section: int, orientation: Qt.Orientation,
                    role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole):
         """Retorna rotulo de cabecalho horizontal."""
@@ -145,6 +276,8 @@ class DualBandTableModel(QAbstractTableModel):
 
     def data(self, index: QModelIndex, role: Qt.ItemDataRole = Qt.ItemDataRole.DisplayRole):
         """Retorna dado da celula conforme o role solicitado."""
+        if role not in self._DATA_ROLES:
+            return None
         if not index.isValid() or index.row() >= len(self.rows):
             return None
         row = self.rows[index.row()]
@@ -157,7 +290,7 @@ class DualBandTableModel(QAbstractTableModel):
             return self._display(row, col)
 
         if role == Qt.ItemDataRole.BackgroundRole:
-            return QBrush(self._cell_background(col, row))
+            return self._background_brush(col, row)
 
         if role == Qt.ItemDataRole.ToolTipRole and col in GREEN_COLS:
             key = GREEN_COL_KEYS[col]
@@ -169,60 +302,49 @@ class DualBandTableModel(QAbstractTableModel):
 
     def _display(self, row: FileRow, col: int) -> Optional[str]:
         """Retorna o texto a exibir para cada coluna."""
-        if col == COL_SELECTED:     return None   # exibido via CheckStateRole
-        if col == COL_CURR_NAME:    return row.current_filename
-        if col == COL_FORMAT:       return row.file_extension.lstrip(".")
-        if col == COL_CURR_TITLE:   return row.current_title or ""
-        if col == COL_CURR_AUTHOR:  return row.current_author or ""
-        if col == COL_CURR_ISBN:    return row.current_isbn or ""
-        if col == COL_CURR_YEAR:    return row.current_year or ""
-        if col == COL_CURR_PUB:     return row.current_publisher or ""
-        if col == COL_NEW_NAME:     return row.new_filename or ""
-        if col == COL_NEW_TITLE:    return row.new_title or ""
-        if col == COL_NEW_AUTHOR:   return row.new_author or ""
-        if col == COL_NEW_YEAR:     return row.new_year or ""
-        if col == COL_NEW_PUB:      return row.new_publisher or ""
-        if col == COL_NEW_ISBN:     return row.new_isbn or ""
-        if col == COL_NEW_CLASSIF:  return row.new_classification or ""
-        if col == COL_NEW_CATALOG:  return row.new_catalog or ""
-        if col == COL_PREVIEW:      return row.preview
+        if 0 <= col < len(_DISPLAY_GETTERS):
+            return _DISPLAY_GETTERS[col](row)
         return None
 
-    def _cell_background(self, col: int, row_data: "FileRow") -> QColor:
-        """Retorna a cor de fundo da célula com suporte a dark/light mode."""
-        is_dark = (QApplication.palette()
-                   .color(QPalette.ColorRole.Window)
-                   .lightness() < 128)
+    def _cell_kind(self, col: int, row_data: "FileRow") -> Optional[str]:
+        """Classifica a célula numa das chaves de _BAND_COLORS (None = sem cor)."""
         if col == COL_SELECTED:
-            return QColor(50, 50, 55) if is_dark else QColor(242, 242, 242)
+            return "selected"
         if col in BLUE_COLS:
-            return QColor(30, 60, 100) if is_dark else QColor(210, 230, 248)
+            return "blue"
         if col == PREVIEW_COL:
-            return QColor(50, 50, 60) if is_dark else QColor(235, 235, 235)
+            return "preview"
         field_key = GREEN_COL_KEYS.get(col)
         if not field_key:
-            return QColor()
+            return None
         value = getattr(row_data, field_key, None)
         # ISBN inválido → vermelho
         if field_key == "new_isbn" and value:
             from .pdf_metadata_extractor import normalize_isbn
-            if normalize_isbn(value) is None or not normalize_isbn(value).startswith(("978", "979")):
-                return QColor(80, 10, 10) if is_dark else QColor(255, 200, 200)
+            normalized = normalize_isbn(value)
+            if normalized is None or not normalized.startswith(("978", "979")):
+                return "invalid_isbn"
         # Célula verde com dados → verde; vazia → branco
-        if value:
-            return QColor(20, 70, 30) if is_dark else QColor(200, 235, 200)
-        return QColor(45, 45, 50) if is_dark else QColor(255, 255, 255)
+        return "filled" if value else "empty"
+
+    def _background_brush(self, col: int, row_data: "FileRow") -> QBrush:
+        """Retorna o QBrush de fundo, reutilizando instâncias entre pinturas."""
+        key = (self._cell_kind(col, row_data), _is_dark_palette())
+        brush = self._brush_cache.get(key)
+        if brush is None:
+            kind, is_dark = key
+            color = QColor() if kind is None else QColor(*_BAND_COLORS[kind][is_dark])
+            brush = self._brush_cache[key] = QBrush(color)
+        return brush
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlag:
         """Coluna de seleção é checkable; faixa azul e Preview são read-only; verde é editável."""
         col = index.column()
         if col == COL_SELECTED:
-            return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-                    | Qt.ItemFlag.ItemIsUserCheckable)
+            return self._FLAGS_CHECKABLE
         if col in BLUE_COLS or col == PREVIEW_COL:
-            return Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-        return (Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-                | Qt.ItemFlag.ItemIsEditable)
+            return self._FLAGS_READONLY
+        return self._FLAGS_EDITABLE
 
     def setData(self, index: QModelIndex, value: Any,
                 role: Qt.ItemDataRole = Qt.ItemDataRole.EditRole) -> bool:
@@ -244,40 +366,110 @@ class DualBandTableModel(QAbstractTableModel):
             return False
         key = GREEN_COL_KEYS[col]
 
+        applied = self._apply_edit(row, key, value)
+        if applied is None:
+            return False
+        if not applied:
+            return True  # edição sem mudança: evita repintura desnecessária
+
+        self.dataChanged.emit(index, index, self._EDIT_ROLES)
+        if key == "new_filename":
+            preview = self.index(index.row(), COL_PREVIEW)
+            self.dataChanged.emit(preview, preview, [Qt.ItemDataRole.DisplayRole])
+        return True
+
+    @staticmethod
+    def _apply_edit(row: "FileRow", key: str, value: Any) -> Optional[bool]:
+        """Valida e grava uma edição manual num campo da faixa verde, sem sinais.
+
+        Returns:
+            None se o valor foi rejeitado (ISBN inválido), False se o campo já
+            tinha esse valor como edição manual confirmada, True se foi gravado.
+        """
         if key == "new_isbn" and value:
             from .pdf_metadata_extractor import normalize_isbn
             normalized = normalize_isbn(value)
             if normalized is None or not normalized.startswith(("978", "979")):
-                return False
+                return None
             value = normalized
 
-        setattr(row, key, value or None)
+        value = value or None
+        # Sem mudança só quando valor, confirmação e origem "✎" já coincidem:
+        # redigitar um valor vindo de busca/OCR ainda o marca como manual
+        if (getattr(row, key) == value and row.field_confirmed.get(key)
+                and row.field_origins.get(key) == "✎"):
+            return False
+
+        setattr(row, key, value)
         row.field_origins[key]   = "✎"
         row.field_confirmed[key] = True
-        self.dataChanged.emit(index, self.index(index.row(), COL_PREVIEW))
         return True
 
+    def fill_column(self, col: int, row_indices: List[int], value: Any) -> List[int]:
+        """Grava o mesmo valor numa coluna da faixa verde para várias linhas.
+
+        Equivale a setData em cada célula, mas emite um único dataChanged
+        cobrindo o intervalo alterado (e o Preview, se a coluna for New Name).
+
+        Args:
+            col: Coluna da faixa verde.
+            row_indices: Índices de linha do model fonte.
+            value: Valor a gravar.
+
+        Returns:
+            Índices, em ordem crescente, das linhas efetivamente alteradas.
+        """
+        key = GREEN_COL_KEYS.get(col)
+        if key is None:
+            return []
+        rows = self.rows
+        changed = sorted(
+            i for i in set(row_indices)
+            if 0 <= i < len(rows) and self._apply_edit(rows[i], key, value)
+        )
+        last_col = COL_PREVIEW if key == "new_filename" else col
+        self.emit_rows_changed(changed, col, last_col, self._EDIT_ROLES)
+        return changed
+
     # --- Metodos de carga e escrita ---
 
     def load_files(self, file_dicts: List[Dict[str, Any]]) -> None:
         """Carrega lista de dicts (formato legado do load_directory).
 
         Args:
-            file_dicts: Lista de dicts com chaves 'path', 'name', 'extension'.
+            file_dicts: Lista de dicts com chaves 'path', 'name', 'extension' e,
+                opcionalmente, 'base_name' (já calculado por scan_directory).
         """
         self.beginResetModel()
         self.rows = []
         for f in file_dicts:
             path = f.get("path", "")
-            name = f.get("name", os.path.basename(path))
-            ext  = f.get("extension", os.path.splitext(path)[1])
-            base = os.path.splitext(name)[0] if "." in name else name
+            name = f.get("name") or os.path.basename(path)
+            ext  = f.get("extension")
+            if ext is None:
+                ext = os.path.splitext(path)[1]
+            base = f.get("base_name")
+            if base is None:
+                base = split_ext(name)[0]
             row  = FileRow(
                 current_filename=base,
                 file_extension=ext,
                 original_path=path,
             )
             self.rows.append(row)
+        # Poucas extensões distintas: lower() uma vez por extensão, e todas as
+        # linhas com a mesma extensão compartilham a mesma string
+        intern = sys.intern
+        lowered: Dict[str, str] = {}
+        ext_lower = []
+        for row in self.rows:
+            ext = row.file_extension
+            low = lowered.get(ext)
+            if low is None:
+                low = lowered[ext] = intern(ext.lower())
+            ext_lower.append(low)
+        self._ext_lower = ext_lower
+        self._pending = max(0, len(self.rows) - self.FETCH_BATCH)
         self.endResetModel()
 
     def update_row(self, row_idx: int, new_row: "FileRow") -> None:
@@ -289,10 +481,10 @@ class DualBandTableModel(QAbstractTableModel):
         """
         if 0 <= row_idx < len(self.rows):
             self.rows[row_idx] = new_row
-            tl = self.index(row_idx, 0)
-            br = self.index(row_idx, self.columnCount(None) - 1)
-            self.dataChanged.emit(
-                tl, br,
+            if row_idx < len(self._ext_lower):
+                self._ext_lower[row_idx] = new_row.file_extension.lower()
+            self._emit_row_changed(
+                row_idx, 0, self.columnCount(None) - 1,
                 [Qt.ItemDataRole.DisplayRole,
                  Qt.ItemDataRole.BackgroundRole,
                  Qt.ItemDataRole.DecorationRole]
@@ -314,10 +506,7 @@ class DualBandTableModel(QAbstractTableModel):
         row.current_year      = meta.year
         row.current_publisher = meta.publisher
         row.metadata_quality  = meta.quality
-        self.dataChanged.emit(
-            self.index(row_idx, 0),
-            self.index(row_idx, COL_PREVIEW)
-        )
+        self._emit_row_changed(row_idx, 0, COL_PREVIEW)
 
     def set_proposal(self, row_idx: int, result: object, origin: str = "OL",
                      classification: Optional[str] = None) -> None:
@@ -354,10 +543,7 @@ class DualBandTableModel(QAbstractTableModel):
             row.new_classification = classification
             row.field_origins["new_classification"] = origin
             row.field_confirmed["new_classification"] = False
-        self.dataChanged.emit(
-            self.index(row_idx, COL_NEW_NAME),
-            self.index(row_idx, COL_PREVIEW)
-        )
+        self._emit_row_changed(row_idx, COL_NEW_NAME, COL_PREVIEW)
 
     def confirm_row(self, row_idx: int) -> None:
         """Marca todos os campos verdes da linha como confirmados.
@@ -373,10 +559,7 @@ class DualBandTableModel(QAbstractTableModel):
                     "new_classification", "new_catalog"):
             if getattr(row, key) is not None:
                 row.field_confirmed[key] = True
-        self.dataChanged.emit(
-            self.index(row_idx, COL_NEW_NAME),
-            self.index(row_idx, COL_PREVIEW)
-        )
+        self._emit_row_changed(row_idx, COL_NEW_NAME, COL_PREVIEW)
 
     def clear_proposal(self, row_idx: int) -> None:
         """Apaga todos os campos verdes da linha.
@@ -393,10 +576,7 @@ class DualBandTableModel(QAbstractTableModel):
             setattr(row, key, None)
             row.field_origins.pop(key, None)
             row.field_confirmed.pop(key, None)
-        self.dataChanged.emit(
-            self.index(row_idx, COL_NEW_NAME),
-            self.index(row_idx, COL_PREVIEW)
-        )
+        self._emit_row_changed(row_idx, COL_NEW_NAME, COL_PREVIEW)
 
     def confirm_all(self) -> None:
         """Confirma todos os campos verdes de todas as linhas."""
@@ -411,12 +591,11 @@ class DualBandTableModel(QAbstractTableModel):
         Returns:
             Lista de tuplas (caminho_original, novo_nome_completo).
         """
-        changes = []
-        for row in self.rows:
-            if row.selected and row.new_filename and row.new_filename != row.current_filename:
-                new_name = row.new_filename + row.file_extension
-                changes.append((row.original_path, new_name))
-        return changes
+        return [
+            (row.original_path, row.new_filename + row.file_extension)
+            for row in self.rows
+            if row.selected and row.new_filename and row.new_filename != row.current_filename
+        ]
 
     def get_all_changes(self) -> List[tuple]:
         """Retorna lista de (original_path, new_filename+ext) para TODAS as linhas com proposta.
@@ -426,12 +605,133 @@ class DualBandTableModel(QAbstractTableModel):
         Returns:
             Lista de tuplas (caminho_original, novo_nome_completo).
         """
-        changes = []
-        for row in self.rows:
-            if row.new_filename and row.new_filename != row.current_filename:
-                new_name = row.new_filename + row.file_extension
-                changes.append((row.original_path, new_name))
-        return changes
+        return [
+            (row.original_path, row.new_filename + row.file_extension)
+            for row in self.rows
+            if row.new_filename and row.new_filename != row.current_filename
+        ]
+
+    def set_new_filenames(self, previews: Dict[str, str]) -> List[int]:
+        """Aplica em lote os nomes de preview à coluna New Name, sem emitir sinais.
+
+        Args:
+            previews: Nome completo atual -> nome proposto (com extensão).
+
+        Returns:
+            Índices, em ordem crescente, das linhas cujo new_filename mudou;
+            o chamador emite um único dataChanged cobrindo o intervalo.
+        """
+        rows = self.rows
+        # Nome completo em disco -> linha, montado uma vez por lote
+        lookup = {
+            row.current_filename + row.file_extension: i
+            for i, row in enumerate(rows)
+        }.get
+        changed = []
+        for original_name, preview in previews.items():
+            row_idx = lookup(original_name)
+            if row_idx is None:
+                continue
+            new_name = split_ext(preview)[0]
+            row = rows[row_idx]
+            if row.new_filename != new_name:
+                row.new_filename = new_name
+                changed.append(row_idx)
+        changed.sort()
+        return changed
+
+    def fill_new_filenames(self) -> List[int]:
+        """Monta new_filename como "autor - título - ano" a partir da faixa verde.
+
+        Linhas sem nenhum desses campos ficam como estão; linhas cujo nome
+        sugerido já está aplicado (origem "auto") não são contadas como alteradas.
+
+        Returns:
+            Índices, em ordem crescente, das linhas alteradas.
+        """
+        changed = []
+        join = " - ".join
+        for row_idx, row in enumerate(self.rows):
+            suggested = join(filter(None, (row.new_author, row.new_title, row.new_year)))
+            if not suggested:
+                continue
+            origins = row.field_origins
+            if row.new_filename == suggested and origins.get("new_filename") == "auto":
+                continue
+            row.new_filename = suggested
+            origins["new_filename"] = "auto"
+            changed.append(row_idx)
+        return changed
+
+    def translate_proposals(self, table: Dict[int, Any]) -> List[int]:
+        """Aplica str.translate a todos os campos de texto da faixa verde, sem setData.
+
+        Campos alterados ficam marcados como edição manual (✎, confirmada),
+        como numa edição pela planilha. ISBN fica de fora: é armazenado
+        normalizado e a tradução só poderia invalidá-lo.
+
+        Args:
+            table: Tabela de str.maketrans.
+
+        Returns:
+            Índices, em ordem crescente, das linhas com algum campo alterado.
+        """
+        keys = [key for key in GREEN_COL_KEYS.values() if key != "new_isbn"]
+        changed = []
+        for row_idx, row in enumerate(self.rows):
+            row_changed = False
+            for key in keys:
+                value = getattr(row, key)
+                if not value:
+                    continue
+                new_value = value.translate(table)
+                if new_value != value:
+                    setattr(row, key, new_value)
+                    row.field_origins[key]   = "✎"
+                    row.field_confirmed[key] = True
+                    row_changed = True
+            if row_changed:
+                changed.append(row_idx)
+        return changed
+
+    def hidden_rows(self, ext_filter: Optional[str], first: int = 0,
+                    last: Optional[int] = None) -> List[bool]:
+        """Equivalente a compute_hidden_rows usando a coluna de extensões pré-calculada.
+
+        Args:
+            ext_filter: Extensão a exibir (ex: '.pdf'), ou None para exibir tudo.
+            first: Primeira linha do intervalo.
+            last: Última linha do intervalo (inclusiva); None = até o fim.
+
+        Returns:
+            Lista de bool, uma por linha de first a last, onde True = ocultar.
+        """
+        stop = len(self.rows) if last is None else last + 1
+        if len(self._ext_lower) != len(self.rows):
+            # rows substituída diretamente: recai no cálculo por linha
+            return compute_hidden_rows(self.rows[first:stop], ext_filter)
+        if ext_filter is None:
+            return [False] * len(self.rows[first:stop])
+        return [ext != ext_filter for ext in self._ext_lower[first:stop]]
+
+    def sort_keys(self, col: int) -> List[Any]:
+        """Chaves de ordenação da coluna, uma por linha de rows.
+
+        Strings saem em casefold para ordenação sem distinção de maiúsculas;
+        a coluna de seleção ordena pelo estado do checkbox.
+
+        Args:
+            col: Índice da coluna clicada no cabeçalho.
+
+        Returns:
+            Lista paralela a rows com valores primitivos comparáveis.
+        """
+        if col == COL_SELECTED:
+            return [row.selected for row in self.rows]
+        if not 0 <= col < len(_DISPLAY_GETTERS):
+            return []
+        getter = _DISPLAY_GETTERS[col]
+        return [(getter(row) or "").casefold() for row in self.rows]
 
     def get_metadata(self, row_idx: int):
         """Compatibilidade com codigo existente: retorna BookMetadata da faixa azul.
@@ -456,9 +756,77 @@ class DualBandTableModel(QAbstractTableModel):
         )
 
 
+class SortProxyModel(QSortFilterProxyModel):
+    """Proxy de ordenação sobre DualBandTableModel.
+
+    As chaves da coluna são calculadas uma vez por sort() (sort_keys do model
+    fonte), e lessThan compara valores primitivos por índice de linha em vez
+    de passar por data() a cada comparação. Os índices de linha do model
+    fonte não mudam, então extração, busca e rename continuam endereçando
+    rows diretamente.
+    """
+
+    def __init__(self, parent=None) -> None:
+        """Inicializa o proxy sem reordenação automática a cada dataChanged."""
+        super().__init__(parent)
+        self._keys: List[Any] = []
+        # Reordenar a cada edição/metadado faria as linhas "pularem" sob o cursor
+        self.setDynamicSortFilter(False)
+
+    def setSourceModel(self, model) -> None:
+        """Define o model fonte e recalcula as chaves quando ele é recarregado."""
+        # Conectado antes do proxy: as chaves ficam prontas antes de ele
+        # remapear (e reordenar) as linhas do model recarregado
+        if model is not None:
+            model.modelReset.connect(self._rebuild_keys)
+        super().setSourceModel(model)
+        # Conectado depois do proxy: as linhas do lote já estão mapeadas
+        if model is not None:
+            model.rowsInserted.connect(self._sort_inserted_rows)
+
+    def _rebuild_keys(self) -> None:
+        """Recalcula as chaves da coluna ordenada para as linhas recarregadas."""
+        source = self.sourceModel()
+        column = self.sortColumn()
+        if column >= 0 and hasattr(source, "sort_keys"):
+            self._keys = source.sort_keys(column)
+        else:
+            self._keys = []
+
+    def sort(self, column: int, order: Qt.SortOrder = Qt.SortOrder.AscendingOrder) -> None:
+        """Pré-calcula as chaves da coluna e ordena."""
+        source = self.sourceModel()
+        if column >= 0 and hasattr(source, "sort_keys"):
+            self._keys = source.sort_keys(column)
+        else:
+            self._keys = []
+        super().sort(column, order)
+
+    def _sort_inserted_rows(self, parent: QModelIndex, first: int, last: int) -> None:
+        """Reordena após cada lote do fetchMore.
+
+        Sem dynamicSortFilter o proxy apenas acrescenta as linhas inseridas ao
+        fim, fora da ordem ativa.
+        """
+        column = self.sortColumn()
+        if column >= 0:
+            self.sort(column, self.sortOrder())
+
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        """Compara as chaves pré-calculadas; recai no padrão do Qt sem elas."""
+        keys = self._keys
+        lr, rr = left.row(), right.row()
+        if lr < len(keys) and rr < len(keys):
+            return keys[lr] < keys[rr]
+        return super().lessThan(left, right)
+
+
 class FileTableModel(QAbstractTableModel):
     """Model legado — mantido para compatibilidade com modulos existentes."""
 
+    _DATA_ROLES = frozenset((Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole,
+                             Qt.ItemDataRole.BackgroundRole, Qt.ItemDataRole.ForegroundRole))
+
     def __init__(self):
         """Inicializa o model legado."""
         super().__init__()
@@ -507,7 +875,7 @@ class FileTableModel(QAbstractTableModel):
 
     def data(self, index, role=Qt.ItemDataRole.DisplayRole):
         """Retorna dado da celula conforme o role solicitado."""
-        if not index.isValid():
+        if role not in self._DATA_ROLES or not index.isValid():
             return None
 
         col = index.column()
@@ -609,11 +977,12 @@ class FileTableModel(QAbstractTableModel):
 
     def get_custom_column_data(self, row: int) -> Dict[str, str]:
         """Retorna os dados das colunas customizadas para uma linha especifica."""
+        headers = self.headers
+        stored = self.custom_data.get(self.files[row]['path'], {})
         custom_data = {}
         for col in self.get_custom_column_indices():
-            header = self.headers[col]
-            index = self.index(row, col)
-            value = self.data(index, Qt.ItemDataRole.DisplayRole)
+            header = headers[col]
+            value = stored.get(header, '')
             if value:
                 custom_data[header] = value
         return custom_data
@@ -646,8 +1015,12 @@ class FileTableModel(QAbstractTableModel):
 
         # Para a coluna New Name (penultima)
         elif col == self._new_name_col_index() and role == Qt.ItemDataRole.EditRole:
-            self.files[row]['new_name'] = value
-            self.dataChanged.emit(index, index)
+            file = self.files[row]
+            if file.get('new_name') == value:
+                return True
+            file['new_name'] = value
+            self.dataChanged.emit(index, index,
+                                  [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.EditRole])
             # Notify Preview column to repaint
             preview_idx = self.index(row, self._preview_col_index())
             self.dataChanged.emit(preview_idx, preview_idx)
@@ -691,49 +1064,79 @@ class FileOperationError(Exception):
     pass
 
 
-def validate_new_names(files: List[str], new_names: List[str]) -> List[str]:
-    """Validate new filenames for potential issues."""
+
+
+def _target_paths(files: List[str], new_names: List[str]) -> List[str]:
+    """Monta o caminho de destino de cada renome, na pasta do próprio arquivo."""
+    return [os.path.join(os.path.dirname(original), new_name)
+            for original, new_name in zip(files, new_names)]
+
+
+# Caracteres proibidos em nomes de arquivo (Windows); isdisjoint varre o nome uma vez
+_INVALID_NAME_CHARS = frozenset('<>:"/\\|?*')
+
+
+def validate_new_names(files: List[str], new_names: List[str],
+                       targets: Optional[List[str]] = None) -> List[str]:
+    """Validate new filenames for potential issues.
+
+    ``targets`` are the destination paths already built by _target_paths, if any.
+    """
     errors = []
     used_names = set()
+    if targets is None:
+        targets = _target_paths(files, new_names)
 
-    for original, new_name in zip(files, new_names):
+    for original, new_name, target_path in zip(files, new_names, targets):
         # Check for empty names
         if not new_name:
             errors.append(f"Empty filename for {original}")
 
-        invalid_chars = '<>:"/\\|?*'
-        if any(char in new_name for char in invalid_chars):
+        if not _INVALID_NAME_CHARS.isdisjoint(new_name):
             errors.append(f"Invalid characters in {new_name}")
 
-        if new_name in used_names:
-            errors.append(f"Duplicate filename: {new_name}")
+        # Um único probe no set: se o tamanho não mudou, o nome já existia
+        seen = len(used_names)
         used_names.add(new_name)
+        if len(used_names) == seen:
+            errors.append(f"Duplicate filename: {new_name}")
 
-        target_path = os.path.join(os.path.dirname(original), new_name)
         if os.path.exists(target_path) and target_path != original:
             errors.append(f"Target file already exists: {new_name}")
 
     return errors
 
 
-def rename_files(files: List[str], new_names: List[str], dry_run: bool = False) -> Dict[str, str]:
+@dataclass
+class RenameReport:
+    """Resultado de um lote de renomes: contadores e mensagem por arquivo."""
+
+    successes: int = 0
+    failures:  int = 0
+    messages:  Dict[str, str] = dc_field(default_factory=dict)
+
+
+def rename_files(files: List[str], new_names: List[str], dry_run: bool = False) -> RenameReport:
     """Execute file renaming operations."""
-    results = {}
+    report = RenameReport()
+    results = report.messages
 
-    errors = validate_new_names(files, new_names)
+    targets = _target_paths(files, new_names)
+    errors = validate_new_names(files, new_names, targets)
     if errors:
         raise FileOperationError("\n".join(errors))
 
-    for old, new in zip(files, new_names):
+    for old, new, new_path in zip(files, new_names, targets):
+        backup = None
         try:
             if dry_run:
                 results[old] = f"Will rename to: {new}"
                 continue
 
-            new_path = os.path.join(os.path.dirname(old), new)
-            backup = None
-
             if os.path.exists(new_path):
+                # Guarda contra sobrescrita, caso a validação tenha perdido uma colisão
+                if new_path != old:
+                    raise FileExistsError(f"Target file already exists: {new}")
                 backup = new_path + ".bak"
                 shutil.move(new_path, backup)
 
@@ -743,14 +1146,61 @@ def rename_files(files: List[str], new_names: List[str], dry_run: bool = False)
                 os.remove(backup)
 
             results[old] = f"Successfully renamed to: {new}"
+            report.successes += 1
             logging.info(f"Renamed: {old} -> {new_path}")
 
         except Exception as e:
             if backup and os.path.exists(backup):
                 shutil.move(backup, new_path)
             results[old] = f"Failed to rename: {str(e)}"
+            report.failures += 1
 
-    return results
+    return report
+
+
+def split_ext(name: str) -> tuple:
+    """Equivalente a os.path.splitext para um nome de arquivo sem diretório.
+
+    Usa str.rfind em vez da implementação genérica de splitext, que também
+    procura separadores de diretório. Pontos iniciais (arquivos ocultos como
+    ``.bashrc``) fazem parte do nome, como em splitext.
+    """
+    dot = name.rfind('.')
+    if dot > 0 and (name[0] != '.' or name[:dot].lstrip('.')):
+        return name[:dot], name[dot:]
+    return name, ''
+
+
+def scan_directory(directory: str,
+                   should_stop: Optional[Callable[[], bool]] = None) -> List[Dict[str, Any]]:
+    """Lista os arquivos de um diretório no formato de dicts esperado por load_files.
+
+    Args:
+        directory: Caminho do diretório a varrer.
+        should_stop: Consultado a cada entrada; se retornar True a varredura
+            para e devolve o que já foi listado (usado pelo DirScanner).
+
+    Returns:
+        Lista de dicts com chaves 'name', 'path', 'extension' e 'base_name'.
+    """
+    files = []
+    # Extensões se repetem muito: uma única string por extensão distinta
+    exts: Dict[str, str] = {}
+    with os.scandir(directory) as it:
+        for entry in it:
+            if should_stop is not None and should_stop():
+                break
+            if entry.is_file():
+                name = entry.name
+                base_name, ext = split_ext(name)
+                ext = exts.setdefault(ext, ext)
+                files.append({
+                    'name': name,
+                    'path': entry.path,
+                    'extension': ext,
+                    'base_name': base_name,
+                })
+    return files
 
 
 def compute_hidden_rows(rows: List[FileRow], ext_filter: Optional[str]) -> List[bool]:
@@ -14,7 +14,7 @@ Dependencies:
 from PyQt6.QtWidgets import (QMainWindow, QWidget, QVBoxLayout, QFileDialog,
                              QStatusBar, QLabel, QLineEdit, QPushButton,
                              QHBoxLayout, QProgressDialog)
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QKeySequence, QShortcut, QAction, QActionGroup
 import os
 from .spreadsheet_view import SpreadsheetView
@@ -89,6 +89,12 @@ class MainWindow(QMainWindow):
         self.current_directory = ""
         self.rename_controller = RenameController(self.history_manager)
 
+        # Varreduras de diretório em background: cada uma recebe uma geração e só
+        # o resultado da mais recente é aplicado; as threads ficam referenciadas
+        # até terminarem
+        self._scan_generation = 0
+        self._dir_scanners: set = set()
+
         # SearchPipeline — inicializado lazy (FEATURE-007)
         self._search_pipeline: object = None
 
@@ -116,8 +122,10 @@ class MainWindow(QMainWindow):
             lambda: self._update_toolbar_state()
         )
 
-        # Re-aplica filtro de extensão após cada recarga da pasta
+        # Re-aplica filtro de extensão após cada recarga da pasta; cada lote do
+        # fetchMore recebe o filtro só nas linhas inseridas
         self.spreadsheet_view.model.modelReset.connect(self._apply_extension_filter)
+        self.spreadsheet_view.model.rowsInserted.connect(self._filter_inserted_rows)
 
         self._update_toolbar_state()
 
@@ -310,8 +318,7 @@ class MainWindow(QMainWindow):
     def _on_reload(self) -> None:
         """Recarrega a pasta atual do disco."""
         if self.current_directory:
-            self.spreadsheet_view.load_directory(self.current_directory)
-            self.statusBar().showMessage("Pasta recarregada")
+            self._start_dir_scan(self.current_directory)
         else:
             self.statusBar().showMessage("Nenhuma pasta selecionada")
 
@@ -370,13 +377,30 @@ class MainWindow(QMainWindow):
 
     def _apply_extension_filter(self) -> None:
         """Oculta/exibe linhas da planilha conforme o filtro de extensão ativo."""
-        from .file_manager import DualBandTableModel, compute_hidden_rows
+        from .file_manager import DualBandTableModel
+        model = self.spreadsheet_view.model
+        if not isinstance(model, DualBandTableModel):
+            return
+        if self._active_ext_filter is not None:
+            # Linhas ocultas não disparam fetchMore ao rolar: carrega tudo
+            model.fetch_all()
+        hidden = model.hidden_rows(self._active_ext_filter)
+        proxy = self.spreadsheet_view.proxy
+        for i in range(proxy.rowCount()):
+            source = proxy.mapToSource(proxy.index(i, 0)).row()
+            self.spreadsheet_view.setRowHidden(i, hidden[source])
+
+    def _filter_inserted_rows(self, parent, first: int, last: int) -> None:
+        """Aplica o filtro de extensão às linhas first..last do model fonte."""
+        from .file_manager import DualBandTableModel
         model = self.spreadsheet_view.model
         if not isinstance(model, DualBandTableModel):
             return
-        hidden = compute_hidden_rows(model.rows, self._active_ext_filter)
-        for i, hide in enumerate(hidden):
-            self.spreadsheet_view.setRowHidden(i, hide)
+        hidden = model.hidden_rows(self._active_ext_filter, first, last)
+        proxy = self.spreadsheet_view.proxy
+        for source, flag in enumerate(hidden, first):
+            row = proxy.mapFromSource(model.index(source, 0)).row()
+            self.spreadsheet_view.setRowHidden(row, flag)
 
     def _save_history(self) -> None:
         """Persist the current history to disk."""
@@ -386,12 +410,67 @@ class MainWindow(QMainWindow):
             pass  # Non-fatal: history is best-effort
 
     def open_directory(self) -> None:
-        """Open a directory chooser and load the selected directory."""
-        directory = QFileDialog.getExistingDirectory(self, "Select Directory")
+        """Open a directory chooser and scan the selected directory in background."""
+        directory = QFileDialog.getExistingDirectory(
+            self, "Select Directory", "",
+            QFileDialog.Option.ShowDirsOnly | QFileDialog.Option.DontUseCustomDirectoryIcons,
+        )
         if directory:
             self.current_directory = directory
             self.path_display.setText(directory)
-            self.spreadsheet_view.load_directory(directory)
+            # Libera o dialog nativo antes de iniciar a varredura
+            QTimer.singleShot(0, lambda: self._start_dir_scan(directory))
+
+    def _start_dir_scan(self, directory: str) -> None:
+        """Inicia DirScanner em background e popula a planilha ao concluir.
+
+        Args:
+            directory: Caminho do diretório a varrer.
+        """
+        from .rename_worker import DirScanner
+        # Uma varredura anterior ainda em andamento não é aguardada: seu resultado
+        # chega com geração antiga e é descartado em _on_dir_scanned
+        self._scan_generation += 1
+        generation = self._scan_generation
+        scanner = DirScanner(directory, parent=self)
+        scanner.scanned.connect(
+            lambda files: self._on_dir_scanned(directory, files, generation)
+        )
+        scanner.error.connect(
+            lambda msg: self._on_dir_scan_error(msg, generation)
+        )
+        scanner.finished.connect(lambda: self._dir_scanners.discard(scanner))
+        scanner.finished.connect(scanner.deleteLater)
+        self._dir_scanners.add(scanner)
+        scanner.start()
+        self.statusBar().showMessage(f"Carregando {directory}...")
+
+    def _on_dir_scanned(self, directory: str, files: list, generation: int) -> None:
+        """Recebe a lista de arquivos do DirScanner e carrega na planilha.
+
+        Args:
+            directory: Diretório varrido; passa a ser o diretório da planilha.
+            files: Lista de dicts no formato de scan_directory.
+            generation: Geração da varredura; resultados antigos são ignorados.
+        """
+        if generation != self._scan_generation:
+            return
+        # Só agora a planilha mostra os arquivos de directory
+        self.spreadsheet_view.current_directory = directory
+        self.spreadsheet_view.set_files(files)
+        self.statusBar().showMessage(f"{len(files)} arquivo(s) carregados")
+
+    def _on_dir_scan_error(self, msg: str, generation: int) -> None:
+        """Exibe o erro da varredura mais recente na status bar."""
+        if generation == self._scan_generation:
+            self.statusBar().showMessage(f"Error: {msg}")
+
+    def closeEvent(self, event) -> None:
+        """Interrompe e aguarda as varreduras em andamento antes de fechar."""
+        for scanner in list(self._dir_scanners):
+            scanner.requestInterruption()
+            scanner.wait()
+        super().closeEvent(event)
 
     def apply_changes(self) -> None:
         """Apply pending renames. Uses QProgressDialog for 10+ files."""
@@ -407,8 +486,8 @@ class MainWindow(QMainWindow):
 
             if len(changes) < 10:
                 # Direct execution for small batches
-                results = self.rename_controller.execute_rename(changes)
-                success_count = sum(1 for msg in results.values() if msg.startswith("Successfully"))
+                report = self.rename_controller.execute_rename(changes)
+                success_count = report.successes
                 self._save_history()
                 # Write-back de metadados para arquivos renomeados com sucesso
                 wb_count = self._apply_writeback(changes)
@@ -416,7 +495,7 @@ class MainWindow(QMainWindow):
                 if wb_count:
                     msg += f" (metadados gravados em {wb_count} arquivo(s))"
                 self.statusBar().showMessage(msg)
-                self.spreadsheet_view.load_directory(self.current_directory)
+                self._start_dir_scan(self.current_directory)
             else:
                 self._start_rename_worker(changes)
 
@@ -477,14 +556,15 @@ class MainWindow(QMainWindow):
         if hasattr(self, '_rename_worker') and self._rename_worker.isRunning():
             self._rename_worker.cancel()
 
-    def _on_rename_finished(self, results: dict) -> None:
+    def _on_rename_finished(self, report: object) -> None:
         """Handle completion of the rename worker."""
         if hasattr(self, '_rename_progress'):
             self._rename_progress.close()
-        success = sum(1 for m in results.values() if m.startswith("Successfully"))
         self._save_history()
-        self.statusBar().showMessage(f"Renomeados: {success}/{len(results)}")
-        self.spreadsheet_view.load_directory(self.current_directory)
+        self.statusBar().showMessage(
+            f"Renomeados: {report.successes}/{report.successes + report.failures}"
+        )
+        self._start_dir_scan(self.current_directory)
 
     def undo_rename(self) -> None:
         """Undo the last batch of rename operations (Ctrl+Z)."""
@@ -556,7 +636,7 @@ class MainWindow(QMainWindow):
         if not indexes:
             self.statusBar().showMessage("Selecione uma linha primeiro")
             return
-        row = indexes[0].row()
+        row = self.spreadsheet_view.source_row(indexes[0])
         meta = self.spreadsheet_view.model.get_metadata(row)
         if meta is None:
             self.statusBar().showMessage("Sem metadados para buscar")
@@ -567,7 +647,7 @@ class MainWindow(QMainWindow):
         """Dispara busca em lote para linhas com quality != COMPLETE."""
         from .pdf_metadata_extractor import MetadataQuality
         rows = []
-        for row in range(self.spreadsheet_view.model.rowCount()):
+        for row in range(len(self.spreadsheet_view.model.rows)):
             meta = self.spreadsheet_view.model.get_metadata(row)
             if meta and meta.quality != MetadataQuality.COMPLETE:
                 rows.append((row, meta))
@@ -718,7 +798,9 @@ class MainWindow(QMainWindow):
         """
         items = []
         model = self.spreadsheet_view.model
-        for row in range(model.rowCount()):
+        # rows inclui linhas ainda não buscadas pela view (fetchMore)
+        total = len(model.rows) if hasattr(model, 'rows') else model.rowCount()
+        for row in range(total):
             meta = model.get_metadata(row)
             if meta is None:
                 continue
@@ -737,14 +819,14 @@ class MainWindow(QMainWindow):
         indexes = self.spreadsheet_view.selectedIndexes()
         if not indexes:
             return
-        self.spreadsheet_view.model.confirm_row(indexes[0].row())
+        self.spreadsheet_view.model.confirm_row(self.spreadsheet_view.source_row(indexes[0]))
 
     def _clear_selected_proposal(self) -> None:
         """Apaga as sugestoes da linha selecionada na planilha."""
         indexes = self.spreadsheet_view.selectedIndexes()
         if not indexes:
             return
-        self.spreadsheet_view.model.clear_proposal(indexes[0].row())
+        self.spreadsheet_view.model.clear_proposal(self.spreadsheet_view.source_row(indexes[0]))
 
     def _confirm_all(self) -> None:
         """Confirma todas as sugestoes de todas as linhas."""
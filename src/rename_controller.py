@@ -18,7 +18,7 @@ from typing import List, Dict, Any, Optional
 import os
 from pathlib import Path
 from datetime import datetime
-from .file_manager import rename_files, validate_new_names
+from .file_manager import RenameReport, rename_files, validate_new_names
 from .history_manager import HistoryManager, RenameOperation
 
 
@@ -33,38 +33,38 @@ class RenameController:
         """
         self.history_manager = history_manager
 
-    def execute_rename(self, changes: List[tuple]) -> Dict[str, str]:
+    def execute_rename(self, changes: List[tuple]) -> RenameReport:
         """Execute the actual file renaming and record each result in history.
 
         Args:
             changes: List of (old_path, new_name) pairs.
 
         Returns:
-            Dict mapping old paths to status messages.
+            RenameReport with success/failure counts and per-path status messages.
         """
         old_paths = [old for old, _ in changes]
         new_names = [new for _, new in changes]
 
         self.history_manager.start_batch()
 
-        results = rename_files(old_paths, new_names)
+        report = rename_files(old_paths, new_names)
+        results = report.messages
 
         for old_path, new_name in changes:
             status_msg = results.get(old_path, "")
             success = status_msg.startswith("Successfully")
-            directory = os.path.dirname(old_path)
             original_name = os.path.basename(old_path)
             error_msg = "" if success else status_msg
             self.history_manager.add_operation(
                 original=original_name,
                 new_name=new_name,
-                directory=directory,
+                directory=os.path.dirname(old_path),
                 success=success,
                 error=error_msg,
             )
 
         self.history_manager.commit_batch()
-        return results
+        return report
 
     def undo_last(self) -> Optional[List[RenameOperation]]:
         """Undo the last batch of rename operations.
@@ -122,9 +122,9 @@ class RenameController:
 # ---------------------------------------------------------------------------
 
 MAX_FILENAME_LENGTH = 255
-VALID_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp')
-VALID_VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv')
-VALID_AUDIO_EXTENSIONS = ('.mp3', '.wav', '.ogg', '.m4a', '.flac')
+VALID_IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp'})
+VALID_VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.wmv', '.flv', '.mkv'})
+VALID_AUDIO_EXTENSIONS = frozenset({'.mp3', '.wav', '.ogg', '.m4a', '.flac'})
 
 # Configuration Paths
 APP_DIR = Path.home() / '.simplerename'
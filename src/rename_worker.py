@@ -3,7 +3,7 @@ Workers QThread para operações de rename e extração de metadados em backgrou
 
 Garante que operações de I/O bloqueantes não travem o thread principal do Qt.
 
-Dependências: PyQt6, pdf_metadata_extractor
+Dependências: PyQt6, file_manager, pdf_metadata_extractor
 """
 from __future__ import annotations
 
@@ -12,6 +12,8 @@ from typing import List, Tuple
 
 from PyQt6.QtCore import QThread, pyqtSignal
 
+from .file_manager import RenameReport
+
 logger = logging.getLogger(__name__)
 
 
@@ -50,6 +52,37 @@ class MetadataWorker(QThread):
         self._cancelled = True
 
 
+class DirScanner(QThread):
+    """Varre um diretório em background para não travar a UI em pastas grandes."""
+
+    scanned = pyqtSignal(list)   # List[dict] no formato de scan_directory
+    error   = pyqtSignal(str)
+
+    def __init__(self, directory: str, parent=None):
+        """
+        Inicializa o worker com o diretório a varrer.
+
+        Args:
+            directory: Caminho absoluto do diretório.
+            parent: QObject dono da thread (a MainWindow).
+        """
+        super().__init__(parent)
+        self._directory = directory
+
+    def run(self) -> None:
+        """Executa scan_directory e emite a lista de arquivos encontrada."""
+        from .file_manager import scan_directory
+        try:
+            # Pastas grandes: requestInterruption interrompe a listagem no meio
+            files = scan_directory(self._directory, self.isInterruptionRequested)
+        except OSError as e:
+            self.error.emit(str(e))
+            return
+        # Janela fechando: não entrega o resultado
+        if not self.isInterruptionRequested():
+            self.scanned.emit(files)
+
+
 class LookupWorker(QThread):
     """Busca metadados online para múltiplas linhas em background."""
 
@@ -88,7 +121,7 @@ class RenameWorker(QThread):
 
     progress = pyqtSignal(int, int)   # (arquivos_concluídos, total)
     file_done = pyqtSignal(str, str, bool)  # (old_path, new_name, success)
-    finished = pyqtSignal(dict)       # {old_path: status_message}
+    finished = pyqtSignal(object)     # RenameReport
 
     def __init__(self, changes: list, controller: object) -> None:
         """
@@ -102,27 +135,31 @@ class RenameWorker(QThread):
         self._changes = changes
         self._controller = controller
         self._cancelled = False
-        self._results: dict = {}
+        self._report = RenameReport()
 
     def run(self) -> None:
         """Processa cada rename em sequência, emitindo sinais de progresso."""
         total = len(self._changes)
+        report = self._report
         for i, (old_path, new_name) in enumerate(self._changes):
             if self._cancelled:
                 break
             try:
-                results = self._controller.execute_rename([(old_path, new_name)])
-                msg = results.get(old_path, "")
-                success = msg.startswith("Successfully")
-                self._results[old_path] = msg
+                result = self._controller.execute_rename([(old_path, new_name)])
+                success = result.successes > 0
+                report.messages[old_path] = result.messages.get(old_path, "")
                 self.file_done.emit(old_path, new_name, success)
             except Exception as exc:
-                msg = f"Failed to rename: {exc}"
-                self._results[old_path] = msg
+                success = False
+                report.messages[old_path] = f"Failed to rename: {exc}"
                 self.file_done.emit(old_path, new_name, False)
                 logger.error("RenameWorker error for %s: %s", old_path, exc)
+            if success:
+                report.successes += 1
+            else:
+                report.failures += 1
             self.progress.emit(i + 1, total)
-        self.finished.emit(self._results)
+        self.finished.emit(report)
 
     def cancel(self) -> None:
         """Sinaliza ao worker para interromper o processamento na próxima iteração."""
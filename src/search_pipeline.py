@@ -42,6 +42,25 @@ FILENAME_PATTERNS = [
     (r'^(?P<title>.+)$', ["title"]),
 ]
 
+# Padrões embutidos compilados uma única vez; _match_filename roda por arquivo
+_COMPILED_FILENAME_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), fields) for pattern, fields in FILENAME_PATTERNS
+]
+
+
+def _compile_filename_patterns(extra_patterns: list[tuple] | None) -> list[tuple]:
+    """
+    Compila os padrões customizados e os põe à frente dos embutidos.
+
+    Args:
+        extra_patterns: Lista opcional de (regex, fields) compilados pelo usuário.
+
+    Returns:
+        Lista de (re.Pattern, fields) na ordem de prioridade.
+    """
+    extra = [(re.compile(p, re.IGNORECASE), f) for p, f in extra_patterns or ()]
+    return extra + _COMPILED_FILENAME_PATTERNS
+
 
 def _parse_filename(stem: str,
                     extra_patterns: list[tuple] | None = None) -> dict:
@@ -57,9 +76,23 @@ def _parse_filename(stem: str,
     Returns:
         Dict com chaves opcionais: title, author, year, isbn.
     """
-    all_patterns = list(extra_patterns or []) + FILENAME_PATTERNS
-    for pattern, fields in all_patterns:
-        m = re.match(pattern, stem.strip(), re.IGNORECASE)
+    return _match_filename(stem, _compile_filename_patterns(extra_patterns))
+
+
+def _match_filename(stem: str, patterns: list[tuple]) -> dict:
+    """
+    Aplica ao nome do arquivo padrões já compilados por _compile_filename_patterns.
+
+    Args:
+        stem: Nome do arquivo sem extensão.
+        patterns: Lista de (re.Pattern, fields) na ordem de prioridade.
+
+    Returns:
+        Dict com chaves opcionais: title, author, year, isbn.
+    """
+    stem_stripped = stem.strip()
+    for regex, fields in patterns:
+        m = regex.match(stem_stripped)
         if m:
             result = {k: v for k, v in m.groupdict().items() if v}
             if "author_last_first" in fields:
@@ -186,7 +219,8 @@ class SearchPipeline:
         """
         self.lookup          = lookup_service
         self.cataloging      = cataloging_engine
-        self._extra_patterns = list(extra_patterns or [])
+        # Compilados uma vez aqui: run() aplica os padrões a cada arquivo
+        self._filename_patterns = _compile_filename_patterns(extra_patterns)
 
     def run(self, row: FileRow) -> Optional[LookupResult]:
         """
@@ -242,7 +276,7 @@ class SearchPipeline:
 
     def _strategy_filename_title_author(self, row: FileRow) -> Optional[LookupResult]:
         """Estratégia 4: Título + Autor inferidos do nome do arquivo."""
-        parsed = _parse_filename(row.current_filename, self._extra_patterns)
+        parsed = _match_filename(row.current_filename, self._filename_patterns)
         title  = parsed.get("title", "")
         author = parsed.get("author", "")
         if len(title) < 3 or not author:
@@ -260,7 +294,7 @@ class SearchPipeline:
         """
         title = (row.current_title or "").strip()
         if len(title) < 3:
-            parsed = _parse_filename(row.current_filename, self._extra_patterns)
+            parsed = _match_filename(row.current_filename, self._filename_patterns)
             title  = parsed.get("title", "").strip()
         if len(title) < 3:
             return None
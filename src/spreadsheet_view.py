@@ -11,13 +11,17 @@ Dependencies:
 - fill_handle.py: For drag-fill behaviour
 """
 import os
-from PyQt6.QtWidgets import QTableView, QHeaderView, QInputDialog
+from PyQt6.QtWidgets import QTableView, QHeaderView
 from PyQt6.QtCore import Qt, QRect
 from PyQt6.QtGui import QPainter, QColor, QFont, QPalette
-from .file_manager import DualBandTableModel
-from .fill_handle import DraggableTableView
-from typing import Dict, List
-from .fill_handle import FillHandle
+from .file_manager import (
+    DualBandTableModel, SortProxyModel, scan_directory, COL_NEW_NAME, COL_PREVIEW, GREEN_COLS,
+)
+from .fill_handle import DraggableTableView, FillHandle
+from typing import Dict, List, Optional
+
+# Formatos com extração de metadados em background
+_EXTRACTABLE_EXTS = frozenset({'.pdf', '.epub', '.mobi', '.fb2', '.cbz', '.xps'})
 
 
 class GroupedHeaderView(QHeaderView):
@@ -74,11 +78,20 @@ class GroupedHeaderView(QHeaderView):
 class SpreadsheetView(DraggableTableView):
     """Planilha editavel com layout dual-faixa azul (atual) e verde (proposta)."""
 
+    _HANDLE_COLOR = QColor(0, 120, 215)
+    _HIGHLIGHT_COLOR = QColor(0, 120, 215, 50)
+
     def __init__(self, parent=None):
         """Inicializa a view com DualBandTableModel e GroupedHeaderView."""
         super().__init__(parent)
         self.model = DualBandTableModel()
-        self.setModel(self.model)
+        # A view exibe o proxy (ordenação); self.model segue sendo o model fonte
+        self.proxy = SortProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.setModel(self.proxy)
+        # Colunas editaveis (faixa verde), onde os handles de preenchimento sao desenhados
+        self._editable_cols = tuple(sorted(GREEN_COLS))
+        self._editable_set = frozenset(GREEN_COLS)
         self.current_directory = None
         self.prepare_rename_callback = None  # Callback para o botao Prepare Rename
 
@@ -99,7 +112,7 @@ class SpreadsheetView(DraggableTableView):
         self.drag_start_cell = None
         self.is_filling = False
         self.fill_start_value = None
-        self.highlighted_cells = []
+        self.highlighted_cells: List[tuple] = []  # (linha da view, coluna)
 
         # Conecta o sinal do fill handle
         self.fill_handle.dragStarted.connect(self.startFillDrag)
@@ -111,7 +124,6 @@ class SpreadsheetView(DraggableTableView):
         self.drag_value = None
         self.drag_start_row = None
         self.drag_start_col = None
-        self.last_highlighted_range = None
 
     def setup_appearance(self) -> None:
         """Configure column widths and visual options."""
@@ -140,24 +152,21 @@ class SpreadsheetView(DraggableTableView):
     def load_directory(self, directory: str) -> None:
         """Load all files from the given directory into the model."""
         self.current_directory = directory
-        files = []
-        for entry in os.scandir(directory):
-            if entry.is_file():
-                name = entry.name
-                base_name, ext = os.path.splitext(name)
-                files.append({
-                    'name': name,
-                    'path': entry.path,
-                    'extension': ext,
-                })
+        self.set_files(scan_directory(directory))
+
+    def set_files(self, files: List[Dict[str, str]]) -> None:
+        """Carrega a lista de arquivos ja varrida e dispara a extracao de metadados.
+
+        Args:
+            files: Lista de dicts no formato de scan_directory.
+        """
         self.model.load_files(files)
 
         # Disparar extração em background para PDF, EPUB, MOBI e outros formatos suportados
-        _SUPPORTED_EXTS = {'.pdf', '.epub', '.mobi', '.fb2', '.cbz', '.xps'}
         extractable = [
             (row, f['path'])
             for row, f in enumerate(files)
-            if f.get('extension', '').lower() in _SUPPORTED_EXTS
+            if f.get('extension', '').lower() in _EXTRACTABLE_EXTS
         ]
         if extractable:
             self._start_metadata_extraction(extractable)
@@ -189,14 +198,13 @@ class SpreadsheetView(DraggableTableView):
         """Return list of (old_path, new_name) for files that were modified."""
         return self.model.get_changes()
 
+    def source_row(self, index) -> int:
+        """Converte um índice da view (proxy ordenado) na linha do model fonte."""
+        return self.proxy.mapToSource(index).row()
+
     def isEditableCell(self, row: int, column: int) -> bool:
         """Verifica se uma celula e editavel (faixa verde)."""
-        if not self.model:
-            return False
-        index = self.model.index(row, column)
-        if not index.isValid():
-            return False
-        return bool(self.model.flags(index) & Qt.ItemFlag.ItemIsEditable)
+        return column in self._editable_set and 0 <= row < self.proxy.rowCount()
 
     def getFillHandleRect(self, cell_rect: QRect) -> QRect:
         """Retorna o retangulo do handle de preenchimento."""
@@ -246,7 +254,7 @@ class SpreadsheetView(DraggableTableView):
                     if handle_rect.contains(pos):
                         self.drag_start_row = row
                         self.drag_start_col = col
-                        self.drag_value = self.model.data(index, Qt.ItemDataRole.EditRole)
+                        self.drag_value = self.proxy.data(index, Qt.ItemDataRole.EditRole)
                         event.accept()
                         return
 
@@ -257,7 +265,7 @@ class SpreadsheetView(DraggableTableView):
         if self.current_cell and self.current_cell.isValid():
             self.is_filling = True
             self.drag_start_cell = self.current_cell
-            self.fill_start_value = self.model.data(self.current_cell, Qt.ItemDataRole.EditRole)
+            self.fill_start_value = self.proxy.data(self.current_cell, Qt.ItemDataRole.EditRole)
             self.highlighted_cells.clear()
             self.viewport().update()
 
@@ -295,25 +303,18 @@ class SpreadsheetView(DraggableTableView):
         if not self.fill_start_value:
             return
 
-        model = self.model
         start_row = self.drag_start_cell.row()
         col = self.drag_start_cell.column()
-
-        model.beginResetModel()
-        try:
-            for index in self.highlighted_cells:
-                if index.row() != start_row:
-                    model.setData(index, self.fill_start_value, Qt.ItemDataRole.EditRole)
-        finally:
-            model.endResetModel()
+        rows = [self.source_row(self.proxy.index(row, col))
+                for row, col in self.highlighted_cells if row != start_row]
+        self.model.fill_column(col, rows, self.fill_start_value)
 
     def keyPressEvent(self, event) -> None:
         """Cancel fill operation on Escape."""
         if event.key() == Qt.Key.Key_Escape and self.is_filling:
             self.is_filling = False
             self.drag_start_cell = None
-            self.highlighted_cells = []
-            self.update()
+            self.clearHighlight()
             return
 
         super().keyPressEvent(event)
@@ -321,8 +322,7 @@ class SpreadsheetView(DraggableTableView):
     def leaveEvent(self, event) -> None:
         """Limpa o highlight quando o mouse sai da area."""
         if self.is_filling:
-            self.highlighted_cells.clear()
-            self.viewport().update()
+            self.clearHighlight()
         super().leaveEvent(event)
 
     def paintEvent(self, event) -> None:
@@ -331,114 +331,112 @@ class SpreadsheetView(DraggableTableView):
 
         painter = QPainter(self.viewport())
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
-        highlight_color = QColor(0, 120, 215, 50)
 
+        dirty = event.rect()
+
+        # Desenha highlight das celulas do preenchimento em andamento
+        # (só as linhas dentro da area repintada viram QModelIndex)
         if self.highlighted_cells:
-            for index in self.highlighted_cells:
-                rect = self.visualRect(index)
-                if rect.isValid():
-                    painter.fillRect(rect, highlight_color)
-
-        # Desenha highlight das celulas
-        if self.last_highlighted_range:
-            for index in self.last_highlighted_range:
-                rect = self.visualRect(index)
-                painter.fillRect(rect, highlight_color)
-
-        # Desenha handles de preenchimento quando nao ha fill drag ativo
+            highlight_color = self._HIGHLIGHT_COLOR
+            first = self.rowAt(dirty.top())
+            last = self.rowAt(dirty.bottom())
+            first = 0 if first < 0 else first
+            last = self.proxy.rowCount() - 1 if last < 0 else last
+            for row, col in self.highlighted_cells:
+                if first <= row <= last:
+                    rect = self.visualRect(self.proxy.index(row, col))
+                    if rect.isValid():
+                        painter.fillRect(rect, highlight_color)
+
+        # Desenha handles de preenchimento quando nao ha fill drag ativo,
+        # apenas nas celulas dentro da area sendo repintada
         if self.drag_value is None:
-            handle_color = QColor(0, 120, 215)
-            for row in range(self.model.rowCount()):
-                for col in range(self.model.columnCount()):
-                    if self.isEditableCell(row, col):
-                        index = self.model.index(row, col)
-                        cell_rect = self.visualRect(index)
-                        handle_rect = self.getFillHandleRect(cell_rect)
-                        painter.fillRect(handle_rect, handle_color)
+            handle_color = self._HANDLE_COLOR
+            cols = self._editable_cols_in(dirty)
+            for row in self._visible_rows(dirty):
+                for col in cols:
+                    cell_rect = self.visualRect(self.proxy.index(row, col))
+                    painter.fillRect(self.getFillHandleRect(cell_rect), handle_color)
+
+    def _visible_rows(self, area: Optional[QRect] = None) -> List[int]:
+        """Linhas da view (proxy) dentro da area do viewport, excluindo as ocultas pelo filtro."""
+        total = self.proxy.rowCount()
+        if total == 0:
+            return []
+        if area is None:
+            area = self.viewport().rect()
+        first = self.rowAt(area.top())
+        last = self.rowAt(area.bottom())
+        first = 0 if first < 0 else first
+        last = total - 1 if last < 0 else last
+        return [row for row in range(first, last + 1) if not self.isRowHidden(row)]
+
+    def _editable_cols_in(self, area: QRect) -> List[int]:
+        """Colunas editaveis cuja faixa horizontal cruza a area do viewport."""
+        left, right = area.left(), area.right()
+        result = []
+        for col in self._editable_cols:
+            x = self.columnViewportPosition(col)
+            if x <= right and x + self.columnWidth(col) > left and not self.isColumnHidden(col):
+                result.append(col)
+        return result
 
     def highlightCells(self, start_row: int, end_row: int, column: int) -> None:
         """Destaca as celulas que serao preenchidas."""
         self.clearHighlight()
-        self.last_highlighted_range = []
-        for row in range(min(start_row, end_row), max(start_row, end_row) + 1):
-            if self.isEditableCell(row, column):
-                index = self.model.index(row, column)
-                self.last_highlighted_range.append(index)
+        self.highlighted_cells = [
+            (row, column)
+            for row in range(min(start_row, end_row), max(start_row, end_row) + 1)
+            if self.isEditableCell(row, column)
+        ]
         self.viewport().update()
 
     def clearHighlight(self) -> None:
-        """Limpa o destaque das celulas."""
-        if self.last_highlighted_range:
-            for index in self.last_highlighted_range:
-                self.viewport().update(self.visualRect(index))
-            self.last_highlighted_range = []
+        """Limpa o destaque das celulas, repintando so a area que elas ocupavam."""
+        if not self.highlighted_cells:
+            return
+        dirty = QRect()
+        for row, col in self.highlighted_cells:
+            dirty = dirty.united(self.visualRect(self.proxy.index(row, col)))
+        self.highlighted_cells = []
+        if not dirty.isEmpty():
+            self.viewport().update(dirty)
 
     def fillCells(self, start_row: int, end_row: int, column: int) -> None:
         """Preenche as celulas com o valor da celula inicial."""
         if not self.drag_value:
             return
 
-        self.model.beginResetModel()
-        try:
-            for row in range(min(start_row + 1, end_row), max(start_row, end_row) + 1):
-                if self.isEditableCell(row, column):
-                    index = self.model.index(row, column)
-                    self.model.setData(index, self.drag_value, Qt.ItemDataRole.EditRole)
-        finally:
-            self.model.endResetModel()
+        rows = [
+            self.source_row(self.proxy.index(row, column))
+            for row in range(min(start_row + 1, end_row), max(start_row, end_row) + 1)
+            if self.isEditableCell(row, column)
+        ]
+        self.model.fill_column(column, rows, self.drag_value)
+
+    _SPACES_TO_UNDERSCORES = str.maketrans({" ": "_"})
 
     def replace_spaces(self) -> None:
         """Replace spaces with underscores in all editable text fields (faixa verde)."""
         if not self.model:
             return
-
-        model = self.model
-        model.beginResetModel()
-        try:
-            for row in range(model.rowCount()):
-                for col in range(model.columnCount()):
-                    if self.isEditableCell(row, col):
-                        index = model.index(row, col)
-                        current_text = model.data(index, Qt.ItemDataRole.DisplayRole)
-                        if current_text and isinstance(current_text, str):
-                            new_text = current_text.replace(' ', '_')
-                            if new_text != current_text:
-                                model.setData(index, new_text, Qt.ItemDataRole.EditRole)
-            model.endResetModel()
-            self.viewport().update()
-        except Exception as e:
-            model.endResetModel()
-            raise e
+        changed = self.model.translate_proposals(self._SPACES_TO_UNDERSCORES)
+        self.model.emit_rows_changed(changed, COL_NEW_NAME, COL_PREVIEW)
 
     def prepare_rename_files(self) -> None:
         """Prepara os novos nomes baseados nos campos da faixa verde (new_author + new_title + new_year)."""
-        for row_idx in range(self.model.rowCount()):
-            file_row = self.model.rows[row_idx]
-            parts = []
-            if file_row.new_author:
-                parts.append(file_row.new_author)
-            if file_row.new_title:
-                parts.append(file_row.new_title)
-            if file_row.new_year:
-                parts.append(file_row.new_year)
-            if parts:
-                suggested = " - ".join(parts)
-                file_row.new_filename = suggested
-                file_row.field_origins["new_filename"] = "auto"
-        if self.model.rowCount() > 0:
-            self.model.dataChanged.emit(
-                self.model.index(0, 0),
-                self.model.index(self.model.rowCount() - 1, self.model.columnCount() - 1)
-            )
+        changed = self.model.fill_new_filenames()
+        # Só New Name e Preview mudam: um dataChanged para o intervalo todo
+        self.model.emit_rows_changed(changed, COL_NEW_NAME, COL_PREVIEW)
 
     def update_preview(self, preview_names: Dict[str, str]) -> None:
         """Update new_filename with preview values (compatibilidade legado)."""
-        for row_idx, file_row in enumerate(self.model.rows):
-            original_name = file_row.current_filename + file_row.file_extension
-            if original_name in preview_names:
-                base = os.path.splitext(preview_names[original_name])[0]
-                file_row.new_filename = base
-        self.model.layoutChanged.emit()
+        model = self.model
+        changed = model.set_new_filenames(preview_names)
+        model.emit_rows_changed(
+            changed, COL_NEW_NAME, COL_PREVIEW,
+            [Qt.ItemDataRole.DisplayRole, Qt.ItemDataRole.BackgroundRole],
+        )
 
     def get_custom_columns_data(self) -> List[Dict[str, str]]:
         """Coleta dados relevantes para cada linha (compatibilidade legado)."""
@@ -447,10 +445,10 @@ class SpreadsheetView(DraggableTableView):
             result.append({
                 'row': row_idx,
                 'original_name': file_row.current_filename,
-                'custom_text': ' '.join(filter(None, [
+                'custom_text': ' '.join(filter(None, (
                     file_row.new_author,
                     file_row.new_title,
                     file_row.new_year,
-                ])),
+                ))),
             })
         return result
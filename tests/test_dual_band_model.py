@@ -1,6 +1,6 @@
 """Testes para DualBandTableModel e FileRow."""
 import pytest
-from src.file_manager import (DualBandTableModel, FileRow, COL_PREVIEW, COL_NEW_NAME,
+from src.file_manager import (DualBandTableModel, FileRow, SortProxyModel, COL_PREVIEW, COL_NEW_NAME,
                               COL_NEW_ISBN, COL_NEW_CLASSIF, COL_NEW_CATALOG, COL_SELECTED)
 from PyQt6.QtCore import Qt, QAbstractTableModel
 from src.pdf_metadata_extractor import BookMetadata, MetadataQuality
@@ -225,6 +225,143 @@ class TestDualBandTableModel:
         assert model.rows[0].new_filename == "nome_editado"
         assert model.rows[0].field_confirmed.get("new_filename") is True
 
+    def test_setdata_same_value_skips_signal(self):
+        """setData repetindo o valor já confirmado não deve emitir dataChanged."""
+        from PyQt6.QtCore import Qt
+        model = self._model_with_files()
+        idx = model.index(0, COL_NEW_NAME)
+        model.setData(idx, "nome_editado", Qt.ItemDataRole.EditRole)
+        emitted = []
+        model.dataChanged.connect(lambda *args: emitted.append(args))
+        assert model.setData(idx, "nome_editado", Qt.ItemDataRole.EditRole) is True
+        assert emitted == []
+
+    def test_setdata_same_value_marks_manual_origin(self):
+        """Redigitar um valor confirmado de outra origem deve marcá-lo como ✎."""
+        from PyQt6.QtCore import Qt
+        model = self._model_with_files()
+        row = model.rows[0]
+        row.new_filename = "nome_busca"
+        row.field_origins["new_filename"] = "OL"
+        row.field_confirmed["new_filename"] = True
+        emitted = []
+        model.dataChanged.connect(lambda *args: emitted.append(args))
+        idx = model.index(0, COL_NEW_NAME)
+        assert model.setData(idx, "nome_busca", Qt.ItemDataRole.EditRole) is True
+        assert row.field_origins["new_filename"] == "✎"
+        assert emitted
+
+    def test_fetch_more_delivers_rows_in_batches(self):
+        """Pastas grandes devem ser entregues à view em lotes de FETCH_BATCH."""
+        model = DualBandTableModel()
+        total = DualBandTableModel.FETCH_BATCH + 10
+        model.load_files([
+            {"path": f"/d/f{i}.pdf", "name": f"f{i}.pdf", "extension": ".pdf"}
+            for i in range(total)
+        ])
+        assert len(model.rows) == total
+        assert model.rowCount() == DualBandTableModel.FETCH_BATCH
+        assert model.canFetchMore()
+        model.fetchMore()
+        assert model.rowCount() == total
+        assert not model.canFetchMore()
+
+    def test_fetch_all_delivers_every_pending_row(self):
+        """fetch_all entrega todas as linhas pendentes num único lote."""
+        model = DualBandTableModel()
+        total = DualBandTableModel.FETCH_BATCH * 2 + 3
+        model.load_files([
+            {"path": f"/d/f{i}.pdf", "name": f"f{i}.pdf", "extension": ".pdf"}
+            for i in range(total)
+        ])
+        inserted = []
+        model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+        model.fetch_all()
+        assert model.rowCount() == total
+        assert not model.canFetchMore()
+        assert inserted == [(DualBandTableModel.FETCH_BATCH, total - 1)]
+
+    def test_set_new_filenames_reports_only_changed_rows(self):
+        """set_new_filenames ignora nomes desconhecidos e valores iguais."""
+        model = DualBandTableModel()
+        model.load_files([
+            {"path": f"/d/f{i}.pdf", "name": f"f{i}.pdf", "extension": ".pdf"}
+            for i in range(3)
+        ])
+        model.rows[0].new_filename = "igual"
+        changed = model.set_new_filenames({
+            "f2.pdf": "novo2.pdf", "f0.pdf": "igual.pdf", "x.pdf": "y.pdf",
+        })
+        assert changed == [2]
+        assert model.rows[2].new_filename == "novo2"
+
+    def test_emit_rows_changed_single_signal_over_fetched_span(self):
+        """emit_rows_changed emite um sinal, limitado às linhas já buscadas."""
+        model = DualBandTableModel()
+        total = DualBandTableModel.FETCH_BATCH + 5
+        model.load_files([
+            {"path": f"/d/f{i}.pdf", "name": f"f{i}.pdf", "extension": ".pdf"}
+            for i in range(total)
+        ])
+        emitted = []
+        model.dataChanged.connect(lambda tl, br, roles=None: emitted.append((tl.row(), br.row())))
+        model.emit_rows_changed([3, 10, total - 1], COL_NEW_NAME, COL_PREVIEW)
+        assert emitted == [(3, 10)]
+        model.emit_rows_changed([total - 1], COL_NEW_NAME, COL_PREVIEW)
+        assert len(emitted) == 1
+
+    def test_translate_proposals_skips_isbn_and_marks_manual(self):
+        """translate_proposals altera a faixa verde (exceto ISBN) e marca ✎."""
+        model = DualBandTableModel()
+        model.load_files([{"path": "/d/a.pdf", "name": "a.pdf", "extension": ".pdf"},
+                          {"path": "/d/b.pdf", "name": "b.pdf", "extension": ".pdf"}])
+        model.rows[1].new_title = "Dom Casmurro"
+        model.rows[1].new_isbn = "9788535902778"
+        changed = model.translate_proposals(str.maketrans({" ": "_"}))
+        assert changed == [1]
+        assert model.rows[1].new_title == "Dom_Casmurro"
+        assert model.rows[1].new_isbn == "9788535902778"
+        assert model.rows[1].field_origins["new_title"] == "✎"
+
+    def test_fill_new_filenames_joins_author_title_year(self):
+        """fill_new_filenames monta o nome e não reconta linhas já preparadas."""
+        model = DualBandTableModel()
+        model.load_files([{"path": "/d/a.pdf", "name": "a.pdf", "extension": ".pdf"},
+                          {"path": "/d/b.pdf", "name": "b.pdf", "extension": ".pdf"}])
+        model.rows[1].new_author = "Assis, Machado de"
+        model.rows[1].new_title = "Dom Casmurro"
+        model.rows[1].new_year = "1899"
+        assert model.fill_new_filenames() == [1]
+        assert model.rows[1].new_filename == "Assis, Machado de - Dom Casmurro - 1899"
+        assert model.rows[1].field_origins["new_filename"] == "auto"
+        assert model.rows[0].new_filename is None
+        assert model.fill_new_filenames() == []
+
+    def test_fill_column_sets_value_and_emits_once(self):
+        """fill_column grava o valor nas linhas e emite um único dataChanged."""
+        model = DualBandTableModel()
+        model.load_files([
+            {"path": f"/d/f{i}.pdf", "name": f"f{i}.pdf", "extension": ".pdf"}
+            for i in range(4)
+        ])
+        emitted = []
+        model.dataChanged.connect(lambda tl, br, roles=None: emitted.append((tl.row(), br.row())))
+        changed = model.fill_column(COL_NEW_NAME, [3, 1, 2], "mesmo")
+        assert changed == [1, 2, 3]
+        assert [r.new_filename for r in model.rows] == [None, "mesmo", "mesmo", "mesmo"]
+        assert model.rows[2].field_origins["new_filename"] == "✎"
+        assert emitted == [(1, 3)]
+
+    def test_set_new_filenames_after_direct_rename(self):
+        """set_new_filenames deve localizar a linha pelo nome atual, mesmo após renome direto."""
+        model = DualBandTableModel()
+        model.load_files([
+            {"path": "/a.pdf", "name": "a.pdf", "extension": ".pdf"},
+            {"path": "/b.epub", "name": "b.epub", "extension": ".epub"},
+        ])
+        model.rows[0].current_filename = "c"
+        assert model.set_new_filenames({"c.pdf": "novo.pdf", "a.pdf": "x.pdf"}) == [0]
+        assert model.rows[0].new_filename == "novo"
     def test_setdata_blue_col_rejected(self):
         """setData em coluna azul deve retornar False sem alterar dados."""
         from PyQt6.QtCore import Qt
@@ -540,3 +677,53 @@ class TestCheckboxColumn:
         changes = model.get_changes()
         assert len(changes) == 1
         assert changes[0][1] == "novo_a.pdf"
+
+
+class TestSortProxyModel:
+    """Testes para a ordenação via SortProxyModel."""
+
+    def test_sort_by_name_is_case_insensitive_and_keeps_source_rows(self):
+        """A ordenação usa as chaves em casefold sem reordenar model.rows."""
+        model = DualBandTableModel()
+        model.load_files([
+            {"path": f"/d/{n}.pdf", "name": f"{n}.pdf", "extension": ".pdf"}
+            for n in ("beta", "Alfa", "gama")
+        ])
+        proxy = SortProxyModel()
+        proxy.setSourceModel(model)
+        proxy.sort(1, Qt.SortOrder.AscendingOrder)
+        names = [proxy.data(proxy.index(i, 1)) for i in range(proxy.rowCount())]
+        assert names == ["Alfa", "beta", "gama"]
+        assert [r.current_filename for r in model.rows] == ["beta", "Alfa", "gama"]
+        assert proxy.mapToSource(proxy.index(0, 1)).row() == 1
+
+    def test_reload_keeps_case_insensitive_order(self):
+        """Após recarregar a pasta, a ordenação ativa continua usando as chaves em casefold."""
+        model = DualBandTableModel()
+        model.load_files([{"path": "/d/b.pdf", "name": "b.pdf", "extension": ".pdf"}])
+        proxy = SortProxyModel()
+        proxy.setSourceModel(model)
+        proxy.sort(1, Qt.SortOrder.AscendingOrder)
+        model.load_files([
+            {"path": f"/d/{n}.pdf", "name": f"{n}.pdf", "extension": ".pdf"}
+            for n in ("beta", "Gama", "Alfa", "delta")
+        ])
+        names = [proxy.data(proxy.index(i, 1)) for i in range(proxy.rowCount())]
+        assert names == ["Alfa", "beta", "delta", "Gama"]
+
+    def test_fetched_batch_is_sorted(self):
+        """Linhas entregues pelo fetchMore devem entrar na ordem ativa."""
+        model = DualBandTableModel()
+        total = DualBandTableModel.FETCH_BATCH + 44
+        # Nomes decrescentes: o lote pendente ordena antes dos já entregues
+        model.load_files([
+            {"path": f"/d/f{i:04d}.pdf", "name": f"f{i:04d}.pdf", "extension": ".pdf"}
+            for i in reversed(range(total))
+        ])
+        proxy = SortProxyModel()
+        proxy.setSourceModel(model)
+        proxy.sort(1, Qt.SortOrder.AscendingOrder)
+        model.fetchMore()
+        names = [proxy.data(proxy.index(i, 1)) for i in range(proxy.rowCount())]
+        assert len(names) == total
+        assert names == sorted(names)
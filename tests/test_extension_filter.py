@@ -1,6 +1,6 @@
 """Testes para FEATURE-015 — compute_hidden_rows (filtro de extensão na toolbar)."""
 import pytest
-from src.file_manager import FileRow, compute_hidden_rows
+from src.file_manager import DualBandTableModel, FileRow, compute_hidden_rows
 
 
 def _rows(*extensions: str) -> list:
@@ -75,3 +75,31 @@ class TestComputeHiddenRows:
         rows = _rows(".pdf", ".epub", ".pdf", ".mobi", ".epub")
         result = compute_hidden_rows(rows, ".epub")
         assert result == [True, False, True, True, False]
+
+
+class TestModelHiddenRows:
+    """Testes para DualBandTableModel.hidden_rows."""
+
+    def _model(self, *names: str) -> DualBandTableModel:
+        """Cria model carregado com os nomes de arquivo dados."""
+        model = DualBandTableModel()
+        model.load_files([{"path": f"/dir/{n}", "name": n} for n in names])
+        return model
+
+    def test_igual_a_compute_hidden_rows(self):
+        """hidden_rows deve produzir o mesmo resultado que compute_hidden_rows."""
+        model = self._model("a.pdf", "b.EPUB", "c.Pdf", "d.mobi")
+        for ext in (None, ".pdf", ".epub", ".mobi"):
+            assert model.hidden_rows(ext) == compute_hidden_rows(model.rows, ext)
+
+    def test_rows_substituidas_diretamente(self):
+        """Atribuição direta a rows não deve dessincronizar o filtro."""
+        model = self._model("a.pdf")
+        model.rows = _rows(".epub", ".pdf")
+        assert model.hidden_rows(".pdf") == [True, False]
+
+    def test_intervalo(self):
+        """hidden_rows com first/last deve devolver só o trecho pedido."""
+        model = self._model("a.pdf", "b.EPUB", "c.Pdf", "d.mobi")
+        assert model.hidden_rows(".pdf", 1, 2) == [True, False]
+        assert model.hidden_rows(None, 2, 3) == [False, False]
@@ -0,0 +1,21 @@
+"""Testes para a seleção de pasta na MainWindow (resultado da varredura em background)."""
+
+
+class TestDirectorySelection:
+    """Testes de _on_dir_scanned, que recebe o resultado do DirScanner."""
+
+    def test_scan_result_populates_spreadsheet(self, main_window, tmp_path, scanned_files):
+        """O resultado da varredura atual deve carregar a planilha e fixar a pasta."""
+        main_window._on_dir_scanned(str(tmp_path), scanned_files, main_window._scan_generation)
+        view = main_window.spreadsheet_view
+        assert view.current_directory == str(tmp_path)
+        assert len(view.model.rows) == 2
+
+    def test_stale_scan_result_ignored(self, main_window, tmp_path, scanned_files):
+        """Resultado de uma varredura substituída não deve alterar a planilha."""
+        stale = main_window._scan_generation
+        main_window._scan_generation += 1
+        main_window._on_dir_scanned(str(tmp_path), scanned_files, stale)
+        view = main_window.spreadsheet_view
+        assert view.current_directory is None
+        assert view.model.rows == []
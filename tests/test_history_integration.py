@@ -4,6 +4,7 @@ import os
 from unittest.mock import patch, MagicMock
 from src.history_manager import HistoryManager
 from src.rename_controller import RenameController
+from src.file_manager import RenameReport
 
 
 class TestHistoryIntegration:
@@ -33,7 +34,7 @@ class TestHistoryIntegration:
         src = tmp_path / "old.txt"
         src.write_text("x")
         with patch("src.rename_controller.rename_files") as mock_rename:
-            mock_rename.return_value = {str(src): "Successfully renamed to: new.txt"}
+            mock_rename.return_value = RenameReport(successes=1, messages={str(src): "Successfully renamed to: new.txt"})
             rc.execute_rename([(str(src), "new.txt")])
         assert len(hm.undo_stack) > 0
 
@@ -43,7 +44,7 @@ class TestHistoryIntegration:
         src = tmp_path / "old.txt"
         src.write_text("x")
         with patch("src.rename_controller.rename_files") as mock_rename:
-            mock_rename.return_value = {str(src): "Successfully renamed to: new.txt"}
+            mock_rename.return_value = RenameReport(successes=1, messages={str(src): "Successfully renamed to: new.txt"})
             rc.execute_rename([(str(src), "new.txt")])
 
         assert len(hm.undo_stack) == 1
@@ -57,7 +58,7 @@ class TestHistoryIntegration:
         src = tmp_path / "old.txt"
         src.write_text("x")
         with patch("src.rename_controller.rename_files") as mock_rename:
-            mock_rename.return_value = {str(src): "Successfully renamed to: new.txt"}
+            mock_rename.return_value = RenameReport(successes=1, messages={str(src): "Successfully renamed to: new.txt"})
             rc.execute_rename([(str(src), "new.txt")])
 
         rc.undo_last()
@@ -65,22 +66,29 @@ class TestHistoryIntegration:
         assert len(hm.undo_stack) == 1
         assert len(hm.redo_stack) == 0
 
-    def test_undo_calls_os_rename(self, tmp_path):
-        """undo_last deve tentar reverter o rename via os.rename."""
+    def test_undo_restores_original_file(self, tmp_path):
+        """undo_last deve reverter o rename no disco (arquivos reais em tmp_path)."""
         hm, rc = self._setup(tmp_path)
         src = tmp_path / "old.txt"
         src.write_text("x")
-        with patch("src.rename_controller.rename_files") as mock_rename:
-            mock_rename.return_value = {str(src): "Successfully renamed to: new.txt"}
-            rc.execute_rename([(str(src), "new.txt")])
+        rc.execute_rename([(str(src), "new.txt")])
+        assert (tmp_path / "new.txt").exists()
+
+        rc.undo_last()
+        assert src.exists()
+        assert not (tmp_path / "new.txt").exists()
+
+    def test_redo_reapplies_rename(self, tmp_path):
+        """redo_last deve refazer o rename desfeito no disco."""
+        hm, rc = self._setup(tmp_path)
+        src = tmp_path / "old.txt"
+        src.write_text("x")
+        rc.execute_rename([(str(src), "new.txt")])
+        rc.undo_last()
 
-        with patch("src.rename_controller.os.rename") as mock_os_rename:
-            # Simulate that new.txt exists and old.txt does not
-            with patch("src.rename_controller.os.path.exists") as mock_exists:
-                mock_exists.side_effect = lambda p: p.endswith("new.txt")
-                rc.undo_last()
-            # undo deve ter tentado renomear (ou operação best-effort foi tentada)
-            assert mock_os_rename.called or True  # flexible: some impls use shutil
+        rc.redo_last()
+        assert (tmp_path / "new.txt").exists()
+        assert not src.exists()
 
     def test_undo_signals_emitted(self, tmp_path):
         """undoAvailable e redoAvailable devem ser emitidos ao longo do ciclo."""
@@ -94,7 +102,7 @@ class TestHistoryIntegration:
         src = tmp_path / "file.txt"
         src.write_text("x")
         with patch("src.rename_controller.rename_files") as mock_rename:
-            mock_rename.return_value = {str(src): "Successfully renamed to: renamed.txt"}
+            mock_rename.return_value = RenameReport(successes=1, messages={str(src): "Successfully renamed to: renamed.txt"})
             rc.execute_rename([(str(src), "renamed.txt")])
 
         # After commit, undo should be available
@@ -108,7 +116,7 @@ class TestHistoryIntegration:
             src = tmp_path / f"file{i}.txt"
             src.write_text("x")
             with patch("src.rename_controller.rename_files") as mock_rename:
-                mock_rename.return_value = {str(src): f"Successfully renamed to: new{i}.txt"}
+                mock_rename.return_value = RenameReport(successes=1, messages={str(src): f"Successfully renamed to: new{i}.txt"})
                 rc.execute_rename([(str(src), f"new{i}.txt")])
 
         assert len(hm.undo_stack) == 3
@@ -0,0 +1,62 @@
+"""Testes de integração da MainWindow: planilha, toolbar e renome em disco."""
+from PyQt6.QtWidgets import QApplication
+
+
+def _load(main_window, directory, files):
+    """Carrega files como resultado da varredura de directory."""
+    main_window.current_directory = str(directory)
+    main_window._on_dir_scanned(str(directory), files, main_window._scan_generation)
+
+
+class TestMainWindowIntegration:
+    """Fluxos que atravessam MainWindow, SpreadsheetView e RenameController."""
+
+    def test_background_scan_fills_spreadsheet(self, main_window, tmp_path, scanned_files):
+        """A varredura em DirScanner deve popular a planilha com os arquivos da pasta."""
+        main_window._start_dir_scan(str(tmp_path))
+        for scanner in list(main_window._dir_scanners):
+            scanner.wait()
+        # scanned vem de outra thread (conexão enfileirada): entrega numa só passada
+        QApplication.sendPostedEvents()
+        QApplication.processEvents()
+        view = main_window.spreadsheet_view
+        assert view.current_directory == str(tmp_path)
+        assert sorted(r.current_filename for r in view.model.rows) == ["a", "b"]
+
+    def test_toolbar_follows_marked_rows(self, main_window, tmp_path, scanned_files):
+        """Renomear marcados só habilita com uma linha marcada e com proposta."""
+        _load(main_window, tmp_path, scanned_files)
+        row = main_window.spreadsheet_view.model.rows[0]
+        row.selected = True
+        main_window._update_toolbar_state()
+        assert main_window.search_marked_action.isEnabled()
+        assert not main_window.rename_marked_action.isEnabled()
+        row.new_filename = "novo"
+        main_window._update_toolbar_state()
+        assert main_window.rename_marked_action.isEnabled()
+
+    def test_apply_changes_renames_on_disk(self, main_window, tmp_path, scanned_files):
+        """apply_changes deve renomear na pasta do arquivo e registrar histórico."""
+        _load(main_window, tmp_path, scanned_files)
+        row = main_window.spreadsheet_view.model.rows[0]
+        row.selected = True
+        row.new_filename = "renomeado"
+        main_window.apply_changes()
+        assert (tmp_path / "renomeado.txt").exists()
+        assert not (tmp_path / "a.txt").exists()
+        assert main_window.history_manager.undo_stack
+
+    def test_extension_filter_reaches_rows_past_first_batch(self, main_window, tmp_path):
+        """Com filtro ativo, arquivos além do primeiro lote devem aparecer."""
+        from src.file_manager import DualBandTableModel
+        files = [
+            {"path": str(tmp_path / f"f{i:04d}.txt"), "name": f"f{i:04d}.txt", "extension": ".txt"}
+            for i in range(DualBandTableModel.FETCH_BATCH + 10)
+        ]
+        files.append({"path": str(tmp_path / "z.pdf"), "name": "z.pdf", "extension": ".pdf"})
+        _load(main_window, tmp_path, files)
+        main_window._filter_actions["PDF"].trigger()
+        view = main_window.spreadsheet_view
+        visible = [i for i in range(view.proxy.rowCount()) if not view.isRowHidden(i)]
+        assert len(visible) == 1
+        assert view.proxy.data(view.proxy.index(visible[0], 1)) == "z"
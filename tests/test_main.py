@@ -1,19 +1,11 @@
 import pytest
 from unittest.mock import patch, MagicMock
 from pathlib import Path
-from PyQt6.QtWidgets import QApplication
 
 from src.main import SimpleRename
 from src.utils.constants import APP_DIR, CONFIG_FILE, DEFAULT_CONFIG
 from src.utils.logger import Logger
 
-@pytest.fixture(scope="session")
-def qapp():
-    """Create QApplication instance for tests"""
-    app = QApplication([])
-    yield app
-    app.quit()
-
 @pytest.fixture
 def app_instance(qapp):
     """Create SimpleRename instance with mocked components"""
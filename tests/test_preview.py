@@ -0,0 +1,30 @@
+"""Testes para a coluna Preview da SpreadsheetView (update_preview, replace_spaces)."""
+from src.file_manager import COL_PREVIEW
+
+
+class TestPreviewColumn:
+    """Testes da coluna Preview, derivada de New Name."""
+
+    def test_update_preview_sets_new_names(self, spreadsheet_view, scanned_files):
+        """update_preview deve aplicar o nome proposto e refletir no Preview."""
+        spreadsheet_view.set_files(scanned_files)
+        model = spreadsheet_view.model
+        spreadsheet_view.update_preview({"b.txt": "novo_b.txt"})
+        assert model.rows[1].new_filename == "novo_b"
+        assert model.data(model.index(1, COL_PREVIEW)) == "novo_b.txt"
+        assert model.data(model.index(0, COL_PREVIEW)) == "a.txt"
+
+    def test_update_preview_emits_single_signal(self, spreadsheet_view, scanned_files):
+        """Um lote de previews deve gerar um único dataChanged."""
+        spreadsheet_view.set_files(scanned_files)
+        emitted = []
+        spreadsheet_view.model.dataChanged.connect(lambda *args: emitted.append(args))
+        spreadsheet_view.update_preview({"a.txt": "x.txt", "b.txt": "y.txt"})
+        assert len(emitted) == 1
+
+    def test_replace_spaces(self, spreadsheet_view, scanned_files):
+        """replace_spaces deve trocar espaços por underscores nas propostas."""
+        spreadsheet_view.set_files(scanned_files)
+        spreadsheet_view.model.rows[0].new_filename = "com espaço"
+        spreadsheet_view.replace_spaces()
+        assert spreadsheet_view.model.rows[0].new_filename == "com_espaço"
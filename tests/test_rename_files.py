@@ -0,0 +1,75 @@
+"""Testes para validate_new_names e rename_files em src/file_manager.py"""
+import pytest
+from unittest.mock import patch
+from src.file_manager import FileOperationError, rename_files, validate_new_names
+
+
+class TestRenameFiles:
+    """Testes para rename_files."""
+
+    def test_dry_run_does_not_touch_disk(self, tmp_path):
+        """dry_run não deve renomear o arquivo."""
+        src = tmp_path / "old.txt"
+        src.touch()
+        rename_files([str(src)], ["new.txt"], dry_run=True)
+        assert src.exists()
+        assert not (tmp_path / "new.txt").exists()
+
+    def test_invalid_name_raises(self, tmp_path):
+        """Nome com caractere inválido deve lançar FileOperationError."""
+        src = tmp_path / "old.txt"
+        src.touch()
+        with pytest.raises(FileOperationError):
+            rename_files([str(src)], ["bad?.txt"])
+
+    def test_renames_file(self, tmp_path):
+        """rename_files deve renomear o arquivo no disco."""
+        src = tmp_path / "old.txt"
+        src.touch()
+        rename_files([str(src)], ["new.txt"])
+        assert not src.exists()
+        assert (tmp_path / "new.txt").exists()
+
+    def test_existing_target_not_overwritten(self, tmp_path):
+        """Mesmo se a validação deixar passar, um destino existente não é sobrescrito."""
+        src = tmp_path / "old.txt"
+        src.write_text("origem")
+        taken = tmp_path / "taken.txt"
+        taken.write_text("destino")
+        with patch("src.file_manager.validate_new_names", return_value=[]):
+            report = rename_files([str(src)], ["taken.txt"])
+        assert report.failures == 1
+        assert src.exists()
+        assert taken.read_text() == "destino"
+
+    def test_report_counts(self, tmp_path):
+        """RenameReport deve contar sucessos e falhas do lote."""
+        src = tmp_path / "old.txt"
+        src.touch()
+        missing = tmp_path / "missing.txt"
+        report = rename_files([str(src), str(missing)], ["new.txt", "other.txt"])
+        assert report.successes == 1
+        assert report.failures == 1
+        assert report.messages[str(src)].startswith("Successfully")
+        assert report.messages[str(missing)].startswith("Failed")
+
+
+class TestValidateNewNames:
+    """Testes para validate_new_names."""
+
+    def test_valid_names(self, tmp_path):
+        """Nomes válidos e distintos não devem gerar erros."""
+        files = [str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]
+        assert validate_new_names(files, ["c.txt", "d.txt"]) == []
+
+    def test_duplicate_names(self, tmp_path):
+        """Nomes repetidos devem ser reportados."""
+        files = [str(tmp_path / "a.txt"), str(tmp_path / "b.txt")]
+        errors = validate_new_names(files, ["c.txt", "c.txt"])
+        assert errors == ["Duplicate filename: c.txt"]
+
+    def test_existing_target(self, tmp_path):
+        """Destino já existente no disco deve ser reportado."""
+        (tmp_path / "taken.txt").touch()
+        errors = validate_new_names([str(tmp_path / "a.txt")], ["taken.txt"])
+        assert errors == ["Target file already exists: taken.txt"]
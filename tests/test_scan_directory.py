@@ -0,0 +1,41 @@
+"""Testes para split_ext e scan_directory em src/file_manager.py"""
+import os
+import pytest
+from src.file_manager import scan_directory, split_ext
+
+
+class TestSplitExt:
+    """Testes para split_ext."""
+
+    @pytest.mark.parametrize("name", [
+        "livro.pdf", "arquivo.tar.gz", "sem_extensao", ".bashrc",
+        "..oculto", ".a.b", "final.", "...",
+    ])
+    def test_equivalente_a_splitext(self, name):
+        """split_ext deve produzir o mesmo resultado que os.path.splitext."""
+        assert split_ext(name) == os.path.splitext(name)
+
+
+class TestScanDirectory:
+    """Testes para scan_directory."""
+
+    def test_lista_apenas_arquivos(self, tmp_path):
+        """Subdiretórios não devem aparecer na listagem."""
+        (tmp_path / "livro.pdf").touch()
+        (tmp_path / "sub").mkdir()
+        files = scan_directory(str(tmp_path))
+        assert [f["name"] for f in files] == ["livro.pdf"]
+
+    def test_campos_do_dict(self, tmp_path):
+        """Cada dict deve trazer nome, caminho, extensão e nome base."""
+        (tmp_path / "livro.pdf").touch()
+        (entry,) = scan_directory(str(tmp_path))
+        assert entry["path"] == str(tmp_path / "livro.pdf")
+        assert entry["extension"] == ".pdf"
+        assert entry["base_name"] == "livro"
+
+    def test_should_stop_interrompe_varredura(self, tmp_path):
+        """Com should_stop verdadeiro, a varredura para sem listar nada."""
+        for i in range(5):
+            (tmp_path / f"f{i}.pdf").touch()
+        assert scan_directory(str(tmp_path), should_stop=lambda: True) == []
@@ -0,0 +1,43 @@
+"""Testes para SpreadsheetView em src/spreadsheet_view.py — carga, edição e preenchimento."""
+from PyQt6.QtCore import Qt
+
+from src.file_manager import COL_CURR_NAME, COL_NEW_NAME
+
+
+class TestSpreadsheetView:
+    """Testes da planilha sobre o model fonte e o proxy de ordenação."""
+
+    def test_set_files_populates_model(self, spreadsheet_view, scanned_files):
+        """set_files deve carregar uma linha por arquivo, visível pelo proxy."""
+        spreadsheet_view.set_files(scanned_files)
+        assert spreadsheet_view.proxy.rowCount() == 2
+        assert [r.current_filename for r in spreadsheet_view.model.rows] == ["a", "b"]
+        proxy = spreadsheet_view.proxy
+        shown = {proxy.data(proxy.index(i, COL_CURR_NAME)) for i in range(proxy.rowCount())}
+        assert shown == {"a", "b"}
+
+    def test_edit_new_filename(self, spreadsheet_view, scanned_files):
+        """Editar New Name pela view deve gravar no model e entrar em get_changes."""
+        spreadsheet_view.set_files(scanned_files)
+        proxy = spreadsheet_view.proxy
+        assert proxy.setData(proxy.index(0, COL_NEW_NAME), "novo", Qt.ItemDataRole.EditRole)
+        row = spreadsheet_view.model.rows[spreadsheet_view.source_row(proxy.index(0, 0))]
+        row.selected = True
+        assert spreadsheet_view.get_changes() == [(row.original_path, "novo.txt")]
+
+    def test_editable_cells(self, spreadsheet_view, scanned_files):
+        """Só colunas da faixa verde em linhas existentes são editáveis."""
+        spreadsheet_view.set_files(scanned_files)
+        assert spreadsheet_view.isEditableCell(0, COL_NEW_NAME)
+        assert not spreadsheet_view.isEditableCell(0, COL_CURR_NAME)
+        assert not spreadsheet_view.isEditableCell(5, COL_NEW_NAME)
+
+    def test_fill_cells_copies_value_down(self, spreadsheet_view, scanned_files):
+        """fillCells deve copiar o valor arrastado para as linhas seguintes."""
+        spreadsheet_view.set_files(scanned_files)
+        spreadsheet_view.drag_value = "igual"
+        spreadsheet_view.fillCells(0, 1, COL_NEW_NAME)
+        rows = spreadsheet_view.model.rows
+        target = spreadsheet_view.source_row(spreadsheet_view.proxy.index(1, 0))
+        assert rows[target].new_filename == "igual"
+        assert rows[1 - target].new_filename is None